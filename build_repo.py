@@ -55,6 +55,9 @@ EXCLUDE = {
     "create_kodi_zip.py",
 }
 
+# Už komprimované soubory se jen ukládají, znovu je deflatovat nemá smysl.
+STORED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".zip", ".mp4", ".webm", ".mkv"}
+
 
 def _should_exclude(rel_path: str) -> bool:
     parts = rel_path.replace("\\", "/").split("/")
@@ -75,7 +78,7 @@ def zip_addon(addon_id: str, src_dir: str, dest_dir: str, version: str) -> str:
     zip_name = f"{addon_id}-{version}.zip"
     zip_path = os.path.join(dest_dir, zip_name)
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
         for dirpath, dirnames, filenames in os.walk(src_dir):
             dirnames[:] = [d for d in dirnames if d not in EXCLUDE and d != "__pycache__"]
             for filename in filenames:
@@ -85,7 +88,9 @@ def zip_addon(addon_id: str, src_dir: str, dest_dir: str, version: str) -> str:
                 rel_to_parent = os.path.relpath(full_path, os.path.dirname(src_dir))
                 if _should_exclude(rel_to_parent):
                     continue
-                zf.write(full_path, rel_to_parent)
+                ext = os.path.splitext(filename)[1].lower()
+                compress_type = zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+                zf.write(full_path, rel_to_parent, compress_type=compress_type)
 
     print(f"  ZIP: {zip_path}")
     return zip_path
@@ -130,11 +135,8 @@ def write_repository_addon(repo_addon_dir: str, base_url: str) -> str:
 
 def write_kodi_index_html(target_dir: str, base_url: str) -> None:
     """HTML výpis souborů ve formátu, který Kodi umí procházet."""
-    entries = []
-    for name in sorted(os.listdir(target_dir)):
-        full = os.path.join(target_dir, name)
-        if os.path.isfile(full):
-            entries.append(name)
+    with os.scandir(target_dir) as it:
+        entries = sorted(entry.name for entry in it if entry.is_file())
     lines = ['<a href="../">../</a>']
     for name in entries:
         lines.append(f'<a href="{name}">{name}</a>')
@@ -238,13 +240,13 @@ def main() -> None:
     if os.path.isdir(os.path.join(ROOT, "docs")):
         shutil.rmtree(os.path.join(ROOT, "docs"))
     os.makedirs(DOCS_REPO_DIR, exist_ok=True)
-    for name in os.listdir(REPO_DIR):
-        src = os.path.join(REPO_DIR, name)
-        dst = os.path.join(DOCS_REPO_DIR, name)
-        if os.path.isdir(src):
-            shutil.copytree(src, dst)
-        else:
-            shutil.copy2(src, dst)
+    with os.scandir(REPO_DIR) as it:
+        for entry in it:
+            dst = os.path.join(DOCS_REPO_DIR, entry.name)
+            if entry.is_dir():
+                shutil.copytree(entry.path, dst)
+            else:
+                shutil.copy2(entry.path, dst)
     with open(os.path.join(ROOT, "docs", ".nojekyll"), "w", encoding="utf-8") as handle:
         handle.write("")
     pages_url = DEFAULT_BASE_URL
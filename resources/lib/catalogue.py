@@ -1,7 +1,10 @@
 """High level catalogue for querying and filtering Webshare content."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import math
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 
 import xbmc
 
@@ -10,10 +13,30 @@ from .parser import MediaItem, parse_media_entry
 from .webshare_api import WebshareAPI
 from .sdilej_api import SdilejAPI, SdilejItem
 
+# Minimum size: 100MB for movies, 50MB for TV shows
+_MIN_SIZE_MOVIE = 100 << 20
+_MIN_SIZE_TV = 50 << 20
+# Basic genre detection from title/filename keywords
+_GENRE_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'action': ('action', 'fight', 'battle', 'war', 'combat'),
+    'comedy': ('comedy', 'funny', 'humor', 'laugh'),
+    'drama': ('drama', 'story', 'life'),
+    'horror': ('horror', 'scary', 'fear', 'terror', 'zombie'),
+    'thriller': ('thriller', 'suspense', 'mystery'),
+    'romance': ('love', 'romance', 'romantic'),
+    'science fiction': ('sci-fi', 'science fiction', 'space', 'future'),
+    'fantasy': ('fantasy', 'magic', 'wizard', 'dragon'),
+    'animation': ('animated', 'cartoon', 'anime'),
+    'documentary': ('documentary', 'docu', 'real story'),
+})
+
 
 class WebshareCatalogue:
     """Compose Webshare search results into Kodi-ready media items."""
 
+    # Most search pages requested concurrently after the first one
+    MAX_PARALLEL_PAGES = 4
+
     def __init__(self, api: WebshareAPI, metadata: Optional[MetadataManager], settings, logger, sdilej_api: Optional[SdilejAPI] = None):
         self._api = api
         self._sdilej_api = sdilej_api
@@ -31,30 +54,14 @@ class WebshareCatalogue:
         subtitles: Optional[str],
         genre: Optional[str],
     ) -> bool:
+        # Cheapest and most selective checks first; the genre match runs last
         # Skip non-movie/tvshow content (trailers, samples, etc.)
         if item.media_type == "other":
             return False
-        
-        # Skip very small files (likely trailers/samples) when filtering for movies
-        # Minimum size: 100MB for movies, 50MB for TV shows
-        if media_type == "movie" and item.size is not None:
-            min_size = 100 * 1024 * 1024  # 100MB in bytes
-            if item.size < min_size:
-                return False
-        elif media_type == "tvshow" and item.size is not None:
-            min_size = 50 * 1024 * 1024  # 50MB in bytes
-            if item.size < min_size:
-                return False
-        
-        # Skip files with very short cleaned titles (likely not full movies)
-        if media_type == "movie" and len(item.cleaned_title.strip()) < 3:
-            return False
-            
         if media_type and item.media_type != media_type:
             return False
         if letter:
-            letter = letter.lower()
-            sort = item.sort_title.lower()
+            sort = item.sort_title_lower
             if letter == "0-9":
                 if not sort[:1].isdigit():
                     return False
@@ -65,6 +72,19 @@ class WebshareCatalogue:
                 # allow UHD to count as HD if requested
                 if not (quality == "hd" and item.quality == "uhd"):
                     return False
+        
+        # Skip very small files (likely trailers/samples) when filtering for movies
+        if media_type == "movie" and item.size is not None:
+            if item.size < _MIN_SIZE_MOVIE:
+                return False
+        elif media_type == "tvshow" and item.size is not None:
+            if item.size < _MIN_SIZE_TV:
+                return False
+        
+        # Skip files with very short cleaned titles (likely not full movies)
+        if media_type == "movie" and len(item.cleaned_title.strip()) < 3:
+            return False
+            
         if audio and audio != "any":
             if audio not in item.audio_languages:
                 return False
@@ -72,39 +92,26 @@ class WebshareCatalogue:
             if subtitles not in item.subtitle_languages:
                 return False
         if genre and genre != "any":
-            # Try to get genres from metadata first
-            genres = []
-            if item.metadata and isinstance(item.metadata, dict):
-                genres = [g.lower() for g in item.metadata.get("genres", []) if isinstance(g, str)]
-            
-            # If no genres from metadata, try to guess from title/filename
-            if not genres:
-                title_lower = item.cleaned_title.lower()
-                filename_lower = item.original_name.lower()
-                
-                # Basic genre detection from title/filename keywords
-                genre_keywords = {
-                    'action': ['action', 'fight', 'battle', 'war', 'combat'],
-                    'comedy': ['comedy', 'funny', 'humor', 'laugh'],
-                    'drama': ['drama', 'story', 'life'],
-                    'horror': ['horror', 'scary', 'fear', 'terror', 'zombie'],
-                    'thriller': ['thriller', 'suspense', 'mystery'],
-                    'romance': ['love', 'romance', 'romantic'],
-                    'science fiction': ['sci-fi', 'science fiction', 'space', 'future'],
-                    'fantasy': ['fantasy', 'magic', 'wizard', 'dragon'],
-                    'animation': ['animated', 'cartoon', 'anime'],
-                    'documentary': ['documentary', 'docu', 'real story']
-                }
-                
-                for genre_name, keywords in genre_keywords.items():
-                    if any(keyword in title_lower or keyword in filename_lower for keyword in keywords):
-                        genres.append(genre_name)
-            
-            # Check if requested genre matches
-            if genre.lower() not in genres:
-                return False
+            return self._matches_genre(item, genre)
         return True
 
+    def _matches_genre(self, item: MediaItem, genre: str) -> bool:
+        genre_lower = genre.lower()
+        # Try to get genres from metadata first
+        genres = []
+        if item.metadata and isinstance(item.metadata, dict):
+            genres = [g.lower() for g in item.metadata.get("genres", []) if isinstance(g, str)]
+        if genres:
+            return genre_lower in genres
+        # If no genres from metadata, guess from title/filename; only the
+        # requested genre's keywords can decide the outcome
+        keywords = _GENRE_KEYWORDS.get(genre_lower)
+        if not keywords:
+            return False
+        title_lower = item.cleaned_title_lower
+        filename_lower = item.original_name_lower
+        return any(keyword in title_lower or keyword in filename_lower for keyword in keywords)
+
     def _convert_sdilej_item(self, item: SdilejItem) -> MediaItem:
         media_type = "movie"
         lower_title = item.title.lower()
@@ -142,6 +149,7 @@ class WebshareCatalogue:
         page_size: Optional[int] = None,
     ) -> Tuple[List[MediaItem], int, int, bool]:
         limit = page_size or self._settings.page_size
+        letter = letter.lower() if letter else letter
         gathered: List[MediaItem] = []
         offset = max(0, start_offset)
         
@@ -158,32 +166,90 @@ class WebshareCatalogue:
                 self._logger(f"Error fetching Sdilej results: {e}", xbmc.LOGERROR)
 
         total: Optional[int] = None
-        default_fetch_size = self._settings.page_size
-        while len(gathered) < limit:
-            fetch_size = max(default_fetch_size, limit)
-            total, files = self._api.search(
-                what=query,
-                category="video",
-                sort=sort,
-                limit=fetch_size,
-                offset=offset,
-            )
-            if not files:
-                break
-            for payload in files:
-                item = parse_media_entry(payload, self._logger)
-                if self._metadata:
-                    self._metadata.enrich(item)
-                if self._passes_filters(item, media_type, letter, quality, audio, subtitles, genre):
+        fetch_size = min(max(self._settings.page_size, limit), WebshareAPI.MAX_SEARCH_LIMIT)
+        scanned = accepted = 0
+        genre_filter = bool(genre and genre != "any")
+        offsets = [offset]
+        while offsets:
+            exhausted = False
+            for page_offset, total, files in self._search_pages(query, sort, fetch_size, offsets):
+                # Entries are parsed lazily and the metadata-free filters run before
+                # the page's lookups are batched; stopping at the limit leaves the
+                # rest of the page for the next offset instead of skipping it
+                wanted = limit - len(gathered)
+                consumed = 0
+                candidates: List[Tuple[int, MediaItem]] = []
+                for payload in files:
+                    consumed += 1
+                    item = parse_media_entry(payload, self._logger)
+                    if self._passes_filters(item, media_type, letter, quality, audio, subtitles, None):
+                        candidates.append((consumed, item))
+                        if not genre_filter and len(candidates) >= wanted:
+                            break
+                if self._metadata and candidates:
+                    self._metadata.enrich_batch(item for _, item in candidates)
+                for position, item in candidates:
+                    if genre_filter and not self._matches_genre(item, genre):
+                        continue
                     gathered.append(item)
+                    accepted += 1
                     if len(gathered) >= limit:
+                        consumed = position
                         break
-            offset += len(files)
-            if total is not None and offset >= total:
+                scanned += consumed
+                offset = page_offset + consumed
+                if not consumed or len(gathered) >= limit or (total is not None and offset >= total):
+                    exhausted = True
+                    break
+                if consumed < fetch_size:
+                    # A short page shifts every later offset of this batch; drop
+                    # the remaining pages and continue from where this one ended
+                    break
+            if exhausted:
                 break
+            offsets = self._next_page_offsets(offset, fetch_size, limit - len(gathered), scanned, accepted, total)
         has_more = bool(total and offset < total)
         return gathered, offset, total or 0, has_more
 
+    def _next_page_offsets(
+        self,
+        offset: int,
+        fetch_size: int,
+        missing: int,
+        scanned: int,
+        accepted: int,
+        total: Optional[int],
+    ) -> List[int]:
+        """Offsets of the pages likely needed to gather ``missing`` more items.
+
+        The estimate uses the filter pass rate seen so far and is capped so a
+        strict filter does not fan out into a burst of API calls.
+        """
+        if accepted:
+            pages = math.ceil(missing * scanned / (accepted * fetch_size))
+        else:
+            pages = self.MAX_PARALLEL_PAGES
+        if total is not None:
+            pages = min(pages, math.ceil((total - offset) / fetch_size))
+        pages = max(1, min(pages, self.MAX_PARALLEL_PAGES))
+        return [offset + index * fetch_size for index in range(pages)]
+
+    def _search_pages(
+        self, query: str, sort: Optional[str], fetch_size: int, offsets: List[int]
+    ) -> Iterator[Tuple[int, int, Iterator[Dict[str, str]]]]:
+        """Yield ``(offset, total, files)`` for each page, requesting them concurrently."""
+
+        def search(page_offset: int) -> Tuple[int, Iterator[Dict[str, str]]]:
+            return self._api.search(what=query, category="video", sort=sort, limit=fetch_size, offset=page_offset)
+
+        if len(offsets) == 1:
+            total, files = search(offsets[0])
+            yield offsets[0], total, files
+            return
+        with ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+            for page_offset, (total, files) in zip(offsets, executor.map(search, offsets)):
+                yield page_offset, total, files
+
     def available_genres(self, media_type: str) -> Optional[List[str]]:
         if not self._metadata:
             return None
@@ -2,19 +2,24 @@
 from __future__ import annotations
 
 import hashlib
+from operator import itemgetter
 from typing import Union
 
 _ITOA64 = b"./0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 _MAGIC = b"$1$"
 
 
-def _to64(value: int, length: int) -> str:
-    """Encode ``value`` using the modified base64 alphabet employed by md5-crypt."""
-    chars = []
-    for _ in range(length):
-        chars.append(chr(_ITOA64[value & 0x3F]))
-        value >>= 6
-    return "".join(chars)
+# Digest bytes of the crypt(3) output groups (0,6,12) (1,7,13) (2,8,14)
+# (3,9,15) (4,10,5) (11), each listed low byte first so the whole digest can be
+# encoded as one little-endian integer, six bits per output character.
+_FINAL_ORDER = itemgetter(12, 6, 0, 13, 7, 1, 14, 8, 2, 15, 9, 3, 5, 10, 4, 11)
+_FINAL_SHIFTS = tuple(range(0, 132, 6))
+
+
+def _encode_final(final: bytes) -> bytes:
+    """Encode the digest using the modified base64 alphabet employed by md5-crypt."""
+    value = int.from_bytes(bytes(_FINAL_ORDER(final)), "little")
+    return bytes([_ITOA64[(value >> shift) & 0x3F] for shift in _FINAL_SHIFTS])
 
 
 def md5_crypt(password: Union[str, bytes], salt: Union[str, bytes]) -> str:
@@ -40,53 +45,32 @@ def md5_crypt(password: Union[str, bytes], salt: Union[str, bytes]) -> str:
         salt_bytes = salt_bytes.split(b"$", 1)[0]
     salt_bytes = salt_bytes[:8]
 
-    ctx = hashlib.md5()
-    ctx.update(password_bytes)
-    ctx.update(_MAGIC)
-    ctx.update(salt_bytes)
-
-    alt = hashlib.md5()
-    alt.update(password_bytes)
-    alt.update(salt_bytes)
-    alt.update(password_bytes)
-    alt_digest = alt.digest()
+    alt_digest = hashlib.md5(password_bytes + salt_bytes + password_bytes).digest()
 
     pwd_len = len(password_bytes)
-    for i in range(pwd_len):
-        ctx.update(alt_digest[i % 16 : (i % 16) + 1])
-
+    # The alternate digest repeated over the password length, then one byte per
+    # bit of the length: NUL for set bits, the first password byte otherwise
+    data = [password_bytes, _MAGIC, salt_bytes, (alt_digest * (pwd_len // 16 + 1))[:pwd_len]]
     i = pwd_len
     while i > 0:
-        if i & 1:
-            ctx.update(b"\x00")
-        else:
-            ctx.update(password_bytes[:1])
+        data.append(b"\x00" if i & 1 else password_bytes[:1])
         i >>= 1
 
-    final = ctx.digest()
+    final = hashlib.md5(b"".join(data)).digest()
 
-    for i in range(1000):
-        ctx = hashlib.md5()
+    # The round inputs repeat every lcm(2, 3, 7) = 42 rounds and only ``final``
+    # changes, so each round hashes one precomputed prefix + final + suffix.
+    steps = []
+    for i in range(42):
+        middle = (salt_bytes if i % 3 else b"") + (password_bytes if i % 7 else b"")
         if i % 2:
-            ctx.update(password_bytes)
+            steps.append((password_bytes + middle, b""))
         else:
-            ctx.update(final)
-        if i % 3:
-            ctx.update(salt_bytes)
-        if i % 7:
-            ctx.update(password_bytes)
-        if i % 2:
-            ctx.update(final)
-        else:
-            ctx.update(password_bytes)
-        final = ctx.digest()
-
-    result = _MAGIC + salt_bytes + b"$"
-    result += _to64((final[0] << 16) | (final[6] << 8) | final[12], 4).encode("ascii")
-    result += _to64((final[1] << 16) | (final[7] << 8) | final[13], 4).encode("ascii")
-    result += _to64((final[2] << 16) | (final[8] << 8) | final[14], 4).encode("ascii")
-    result += _to64((final[3] << 16) | (final[9] << 8) | final[15], 4).encode("ascii")
-    result += _to64((final[4] << 16) | (final[10] << 8) | final[5], 4).encode("ascii")
-    result += _to64(final[11], 2).encode("ascii")
-
-    return result.decode("ascii")
+            steps.append((b"", middle + password_bytes))
+
+    md5 = hashlib.md5
+    for i in range(1000):
+        prefix, suffix = steps[i % 42]
+        final = md5(prefix + final + suffix).digest()
+
+    return (_MAGIC + salt_bytes + b"$" + _encode_final(final)).decode("ascii")
@@ -1,20 +1,66 @@
 """Metadata providers for enriching Webshare items."""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import quote
 
 import requests
 import xbmc
+import xbmcgui
+import xbmcvfs
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .parser import MediaItem
+from .title_mapping import CZECH_TO_ENGLISH_MAPPING
 
 _TMDb_IMAGE_BASE = "https://image.tmdb.org/t/p/"
 _TMDb_POSTER_SIZE = "w500"
 _TMDb_FANART_SIZE = "w780"
+# Genre lists persisted across add-on invocations, keyed by "<language>:<media type>"
+_GENRE_CACHE_FILE = "special://temp/tvstreamcz_genres.json"
+# ASCII bytes _normalise() drops; anything non-ASCII is dropped by the encode
+_NORMALISE_DELETE = bytes(code for code in range(128) if not chr(code).isdigit() and not "a" <= chr(code) <= "z")
+# Connections kept per provider host; matches MetadataManager.BATCH_WORKERS
+_POOL_MAXSIZE = 8
+
+
+def _pooled_session() -> requests.Session:
+    """Session with a keep-alive pool sized for concurrent lookups and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=32)
+def _csfd_episode_re(season_number: int) -> Pattern[str]:
+    """Position codes (S01E02) of one season, optionally followed by a title."""
+    return re.compile(r"S0?%dE(\d+)(?:[^>]*>([^<]+))?" % season_number, re.IGNORECASE)
+
+
+def _release_year(result: Dict[str, object]) -> Optional[int]:
+    release_date = result.get("release_date") or result.get("first_air_date")
+    if release_date:
+        try:
+            return int(release_date.split("-", 1)[0])
+        except (ValueError, AttributeError):
+            return None
+    return None
 
 
 class MetadataProvider:
@@ -22,7 +68,7 @@ class MetadataProvider:
 
     name = "base"
 
-    def enrich(self, item: MediaItem) -> Optional[Dict[str, object]]:  # pragma: no cover - interface
+    def enrich(self, item: MediaItem, detailed: bool = False) -> Optional[Dict[str, object]]:  # pragma: no cover - interface
         raise NotImplementedError
 
     def get_genres(self, media_type: str) -> Optional[List[str]]:  # pragma: no cover - interface
@@ -39,16 +85,38 @@ class ProviderContext:
 class TMDbMetadataProvider(MetadataProvider):
     name = "tmdb"
 
-    def __init__(self, api_key: str, language: str, region: Optional[str], logger):
+    # Soft budget for cached detail responses, measured by raw JSON size
+    DETAILS_CACHE_BYTES = 4_000_000
+    # Best search match remembered per title, year, region and language
+    SEARCH_CACHE_SIZE = 256
+    # Genre lists rarely change; reuse the on-disk copy for 30 days
+    GENRE_CACHE_TTL = 30 * 24 * 3600
+
+    def __init__(
+        self, api_key: str, language: str, region: Optional[str], logger, session: Optional[requests.Session] = None
+    ):
         self._api_key = api_key
-        self._ctx = ProviderContext(requests.Session(), language, region or None)
+        self._ctx = ProviderContext(session or _pooled_session(), language, region or None)
         self._logger = logger
-        self._genre_cache: Dict[str, List[str]] = {}
+        self._genre_cache: Dict[str, Dict[int, str]] = {}
+        self._genre_disk: Optional[Dict[str, Dict[str, object]]] = None
+        self._details_cache: "OrderedDict[tuple, Tuple[Dict[str, object], int]]" = OrderedDict()
+        self._details_bytes = 0
+        self._search_cache: "OrderedDict[tuple, Optional[Dict[str, object]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _request(
+        self, path: str, params: Optional[Dict[str, object]] = None, language: Optional[str] = None
+    ) -> Optional[Dict[str, object]]:
+        return self._request_sized(path, params, language)[0]
 
-    def _request(self, path: str, params: Optional[Dict[str, object]] = None) -> Optional[Dict[str, object]]:
+    def _request_sized(
+        self, path: str, params: Optional[Dict[str, object]] = None, language: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, object]], int]:
+        """Like ``_request`` but also return the raw response size in bytes."""
         payload = {
             "api_key": self._api_key,
-            "language": self._ctx.language,
+            "language": language or self._ctx.language,
         }
         if params:
             payload.update(params)
@@ -59,19 +127,19 @@ class TMDbMetadataProvider(MetadataProvider):
             response.raise_for_status()
         except requests.RequestException as exc:
             self._logger(f"TMDb request failed ({path}): {exc}", xbmc.LOGWARNING)
-            return None
+            return None, 0
         try:
-            return response.json()
+            return json.loads(response.content), len(response.content)
         except json.JSONDecodeError as exc:
             self._logger(f"TMDb JSON decode error ({path}): {exc}", xbmc.LOGWARNING)
-            return None
+            return None, 0
 
     def _normalise(self, value: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "", value.lower())
+        return value.lower().encode("ascii", "ignore").translate(None, _NORMALISE_DELETE).decode("ascii")
 
-    def _candidate_score(self, query: MediaItem, title: str, year: Optional[int]) -> int:
+    def _candidate_score(self, query: MediaItem, cleaned_query: str, title: str, year: Optional[int]) -> int:
+        """Score ``title``/``year`` against ``query``; ``cleaned_query`` is its normalised title."""
         score = 0
-        cleaned_query = self._normalise(query.cleaned_title)
         cleaned_title = self._normalise(title)
         if cleaned_query == cleaned_title:
             score += 80
@@ -91,10 +159,28 @@ class TMDbMetadataProvider(MetadataProvider):
             return None
         return f"{_TMDb_IMAGE_BASE}{size}{path}"
 
-    @lru_cache(maxsize=128)
     def _details(self, media_type: str, tmdb_id: int) -> Optional[Dict[str, object]]:
+        # Keyed by language too, so the English fallback never serves Czech details
+        key = (media_type, tmdb_id, self._ctx.language)
+        with self._cache_lock:
+            cached = self._details_cache.get(key)
+            if cached is not None:
+                self._details_cache.move_to_end(key)
+                return cached[0]
         endpoint = "movie" if media_type == "movie" else "tv"
-        return self._request(f"{endpoint}/{tmdb_id}")
+        data, size = self._request_sized(f"{endpoint}/{tmdb_id}")
+        if data is None:
+            return None
+        with self._cache_lock:
+            previous = self._details_cache.pop(key, None)
+            if previous is not None:
+                self._details_bytes -= previous[1]
+            self._details_cache[key] = (data, size)
+            self._details_bytes += size
+            while self._details_bytes > self.DETAILS_CACHE_BYTES and len(self._details_cache) > 1:
+                _, (_, evicted_size) = self._details_cache.popitem(last=False)
+                self._details_bytes -= evicted_size
+        return data
 
     def _search(self, media_type: str, item: MediaItem) -> Optional[Dict[str, object]]:
         endpoint = "search/movie" if media_type == "movie" else "search/tv"
@@ -105,36 +191,61 @@ class TMDbMetadataProvider(MetadataProvider):
             params["first_air_date_year"] = item.guessed_year
         if self._ctx.region:
             params["region"] = self._ctx.region
+        # The pick depends only on these; case and season do not change it
+        key = (media_type, item.cleaned_title_lower, item.guessed_year, self._ctx.region, self._ctx.language)
+        with self._cache_lock:
+            if key in self._search_cache:
+                self._search_cache.move_to_end(key)
+                return self._search_cache[key]
         data = self._request(endpoint, params)
-        if not data or not data.get("results"):
+        if data is None:
+            # Failed request; leave it uncached so the next lookup retries
             return None
-        scored: List[Dict[str, object]] = []
-        for result in data["results"]:
-            title_field = result.get("title") or result.get("name") or ""
-            year_field: Optional[int] = None
-            release_date = result.get("release_date") or result.get("first_air_date")
-            if release_date:
-                try:
-                    year_field = int(release_date.split("-", 1)[0])
-                except (ValueError, AttributeError):
-                    year_field = None
-            score = self._candidate_score(item, title_field, year_field)
-            result["__score"] = score
-            result["__year"] = year_field
-            scored.append(result)
-        scored.sort(key=lambda entry: entry.get("__score", 0), reverse=True)
-        return scored[0] if scored else None
-
-    def enrich(self, item: MediaItem) -> Optional[Dict[str, object]]:
+        best = self._best_result(item, data.get("results") or [])
+        with self._cache_lock:
+            self._search_cache[key] = best
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return best
+
+    def _best_result(self, item: MediaItem, results: List[Dict[str, object]]) -> Optional[Dict[str, object]]:
+        # Highest score this query can reach; no later result can beat a match
+        # scoring it, so the scan stops there. Ties keep the first result.
+        best_possible = 80
+        if item.guessed_year:
+            best_possible += 30
+        if item.media_type == "tvshow" and item.season is not None:
+            best_possible += 10
+        cleaned_query = self._normalise(item.cleaned_title)
+        best: Optional[Dict[str, object]] = None
+        best_score = 0
+        for result in results:
+            score = self._candidate_score(item, cleaned_query, result.get("title") or result.get("name") or "", _release_year(result))
+            if best is None or score > best_score:
+                best, best_score = result, score
+                if score >= best_possible:
+                    break
+        return best
+
+    def enrich(self, item: MediaItem, detailed: bool = False) -> Optional[Dict[str, object]]:
         candidate = self._search(item.media_type, item)
         if not candidate:
             return None
         tmdb_id = candidate.get("id")
         if tmdb_id is None:
             return None
-        details = self._details(item.media_type, int(tmdb_id))
-        if not details:
-            return None
+        # The search result has everything but genre names and the IMDb id;
+        # its genre ids resolve through the cached genre list instead
+        genre_names = None if detailed else self._genre_map(item.media_type)
+        if genre_names is not None:
+            details = candidate
+            genres = [genre_names[genre_id] for genre_id in candidate.get("genre_ids", []) if genre_id in genre_names]
+        else:
+            details = self._details(item.media_type, int(tmdb_id))
+            if not details:
+                return None
+            genres = [genre.get("name") for genre in details.get("genres", []) if genre.get("name")]
         title = details.get("title") or details.get("name") or item.cleaned_title
         original_title = details.get("original_title") or details.get("original_name")
         overview = details.get("overview") or candidate.get("overview")
@@ -147,7 +258,6 @@ class TMDbMetadataProvider(MetadataProvider):
                 year = int(release_date.split("-", 1)[0])
             except (ValueError, AttributeError):
                 year = None
-        genres = [genre.get("name") for genre in details.get("genres", []) if genre.get("name")]
         rating = details.get("vote_average")
         vote_count = details.get("vote_count")
         imdb_id = (details.get("imdb_id") or "").strip()
@@ -169,26 +279,77 @@ class TMDbMetadataProvider(MetadataProvider):
             metadata["tvshowtitle"] = title
         return metadata
 
-    def get_genres(self, media_type: str) -> Optional[List[str]]:
+    def _genre_map(self, media_type: str) -> Optional[Dict[int, str]]:
         if media_type in self._genre_cache:
             return self._genre_cache[media_type]
+        disk_key = f"{self._ctx.language}:{media_type}"
+        entry = self._genre_disk_entries().get(disk_key)
+        if entry and time.time() - entry.get("saved", 0) < self.GENRE_CACHE_TTL:
+            names = {int(genre_id): name for genre_id, name in entry.get("genres", {}).items()}
+            self._genre_cache[media_type] = names
+            return names
         endpoint = "genre/movie/list" if media_type == "movie" else "genre/tv/list"
         data = self._request(endpoint)
         if not data or not data.get("genres"):
             return None
-        names = [genre.get("name") for genre in data["genres"] if genre.get("name")]
+        names = {genre.get("id"): genre.get("name") for genre in data["genres"] if genre.get("name")}
         self._genre_cache[media_type] = names
+        self._save_genre_entry(disk_key, names)
         return names
+
+    def _genre_disk_entries(self) -> Dict[str, Dict[str, object]]:
+        with self._cache_lock:
+            if self._genre_disk is None:
+                self._genre_disk = {}
+                try:
+                    with open(xbmcvfs.translatePath(_GENRE_CACHE_FILE), "r", encoding="utf-8") as handle:
+                        loaded = json.load(handle)
+                    if isinstance(loaded, dict):
+                        self._genre_disk = loaded
+                except (OSError, ValueError):
+                    pass
+            return self._genre_disk
+
+    def _save_genre_entry(self, disk_key: str, names: Dict[int, str]) -> None:
+        path = xbmcvfs.translatePath(_GENRE_CACHE_FILE)
+        with self._cache_lock:
+            entries = dict(self._genre_disk or {})
+            entries[disk_key] = {"saved": time.time(), "genres": names}
+            self._genre_disk = entries
+            try:
+                # Write then rename so a concurrent reader never sees half a file
+                with open(path + ".tmp", "w", encoding="utf-8") as handle:
+                    json.dump(entries, handle)
+                os.replace(path + ".tmp", path)
+            except OSError as exc:
+                self._logger(f"TMDb genre cache write failed: {exc}", xbmc.LOGDEBUG)
+
+    def get_genres(self, media_type: str) -> Optional[List[str]]:
+        names = self._genre_map(media_type)
+        if names is None:
+            return None
+        return list(names.values())
     
+    def _search_tv_results(self, params: Dict[str, object]) -> Optional[Dict[str, object]]:
+        """Search TV shows in the configured language, falling back to English.
+
+        The English request is only sent when the first one finds nothing; it
+        passes its language per request so the shared context is never modified.
+        """
+        data = self._request("search/tv", params)
+        if (data and data.get("results")) or self._ctx.language == "en-US":
+            return data
+        self._logger(f"No results with {self._ctx.language}, trying English", xbmc.LOGINFO)
+        return self._request("search/tv", params, "en-US")
+
     def search_tv_series(self, series_name: str) -> Optional[Dict[str, object]]:
         """Search for TV series and get season information with fallback."""
-        from .title_mapping import CZECH_TO_ENGLISH_MAPPING
-        
         # Try multiple search strategies
-        search_terms = [series_name.lower()]
+        series_key = series_name.lower()
+        search_terms = [series_key]
         
         # Add English equivalent if available
-        english_title = CZECH_TO_ENGLISH_MAPPING.get(series_name.lower())
+        english_title = CZECH_TO_ENGLISH_MAPPING.get(series_key)
         if english_title:
             search_terms.append(english_title)
             self._logger(f"Using English mapping: '{series_name}' -> '{english_title}'", xbmc.LOGINFO)
@@ -202,16 +363,7 @@ class TMDbMetadataProvider(MetadataProvider):
             if self._ctx.region:
                 params["region"] = self._ctx.region
                 
-            data = self._request("search/tv", params)
-            
-            # If no results with current language, try English
-            if not data or not data.get("results"):
-                self._logger(f"No results with {self._ctx.language}, trying English", xbmc.LOGINFO)
-                # Temporarily switch to English
-                original_lang = self._ctx.language
-                self._ctx.language = "en-US"
-                data = self._request("search/tv", params)
-                self._ctx.language = original_lang
+            data = self._search_tv_results(params)
             
             if data and data.get("results"):
                 self._logger(f"Found {len(data['results'])} results for '{search_term}'", xbmc.LOGINFO)
@@ -285,171 +437,123 @@ class TMDbMetadataProvider(MetadataProvider):
         
         return episodes
     
-    def get_popular_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
-        """Get popular movies from TMDb."""
-        data = self._request("movie/popular", {"page": page})
+    def _listing(self, endpoint: str, params: Dict[str, object], formatter, region: bool = False) -> Optional[List[Dict[str, object]]]:
+        """Fetch one page of a TMDb listing endpoint and format its results."""
+        if region and self._ctx.region:
+            params["region"] = self._ctx.region
+        data = self._request(endpoint, params)
         if not data or not data.get("results"):
             return None
-        return self._format_movie_results(data["results"])
-    
+        return formatter(data["results"])
+
+    def get_popular_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
+        """Get popular movies from TMDb."""
+        return self._listing("movie/popular", {"page": page}, self._format_movie_results)
+
     def get_top_rated_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get top rated movies from TMDb."""
-        data = self._request("movie/top_rated", {"page": page})
-        if not data or not data.get("results"):
-            return None
-        return self._format_movie_results(data["results"])
-    
+        return self._listing("movie/top_rated", {"page": page}, self._format_movie_results)
+
     def get_now_playing_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get movies currently in theaters."""
-        params = {"page": page}
-        if self._ctx.region:
-            params["region"] = self._ctx.region
-        data = self._request("movie/now_playing", params)
-        if not data or not data.get("results"):
-            return None
-        return self._format_movie_results(data["results"])
-    
+        return self._listing("movie/now_playing", {"page": page}, self._format_movie_results, region=True)
+
     def get_upcoming_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get upcoming movies."""
-        params = {"page": page}
-        if self._ctx.region:
-            params["region"] = self._ctx.region
-        data = self._request("movie/upcoming", params)
-        if not data or not data.get("results"):
-            return None
-        return self._format_movie_results(data["results"])
-    
+        return self._listing("movie/upcoming", {"page": page}, self._format_movie_results, region=True)
+
     def get_popular_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get popular TV shows from TMDb."""
-        data = self._request("tv/popular", {"page": page})
-        if not data or not data.get("results"):
-            return None
-        return self._format_tv_results(data["results"])
-    
+        return self._listing("tv/popular", {"page": page}, self._format_tv_results)
+
     def get_top_rated_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get top rated TV shows from TMDb."""
-        data = self._request("tv/top_rated", {"page": page})
-        if not data or not data.get("results"):
-            return None
-        return self._format_tv_results(data["results"])
-    
+        return self._listing("tv/top_rated", {"page": page}, self._format_tv_results)
+
     def get_airing_today_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows airing today."""
-        data = self._request("tv/airing_today", {"page": page})
-        if not data or not data.get("results"):
-            return None
-        return self._format_tv_results(data["results"])
-    
+        return self._listing("tv/airing_today", {"page": page}, self._format_tv_results)
+
     def get_on_the_air_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows currently on the air."""
-        data = self._request("tv/on_the_air", {"page": page})
-        if not data or not data.get("results"):
-            return None
-        return self._format_tv_results(data["results"])
-    
+        return self._listing("tv/on_the_air", {"page": page}, self._format_tv_results)
+
     def get_movies_by_genre(self, genre_id: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get movies by genre."""
-        params = {"with_genres": genre_id, "page": page, "sort_by": "popularity.desc"}
-        if self._ctx.region:
-            params["region"] = self._ctx.region
-        data = self._request("discover/movie", params)
-        if not data or not data.get("results"):
-            return None
-        return self._format_movie_results(data["results"])
-    
+        return self._listing("discover/movie", {"with_genres": genre_id, "page": page, "sort_by": "popularity.desc"}, self._format_movie_results, region=True)
+
     def get_tv_shows_by_genre(self, genre_id: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows by genre."""
-        params = {"with_genres": genre_id, "page": page, "sort_by": "popularity.desc"}
-        data = self._request("discover/tv", params)
-        if not data or not data.get("results"):
-            return None
-        return self._format_tv_results(data["results"])
+        return self._listing("discover/tv", {"with_genres": genre_id, "page": page, "sort_by": "popularity.desc"}, self._format_tv_results)
 
     def get_movies_by_year(self, year: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get movies by release year."""
-        params = {"primary_release_year": year, "page": page, "sort_by": "popularity.desc"}
-        if self._ctx.region:
-            params["region"] = self._ctx.region
-        data = self._request("discover/movie", params)
-        if not data or not data.get("results"):
-            return None
-        return self._format_movie_results(data["results"])
+        return self._listing("discover/movie", {"primary_release_year": year, "page": page, "sort_by": "popularity.desc"}, self._format_movie_results, region=True)
 
     def get_tv_shows_by_year(self, year: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows by first air year."""
-        params = {"first_air_date_year": year, "page": page, "sort_by": "popularity.desc"}
-        data = self._request("discover/tv", params)
-        if not data or not data.get("results"):
-            return None
-        return self._format_tv_results(data["results"])
+        return self._listing("discover/tv", {"first_air_date_year": year, "page": page, "sort_by": "popularity.desc"}, self._format_tv_results)
 
     def get_genre_list(self, media_type: str) -> Optional[Dict[int, str]]:
         """Get list of genres with IDs."""
-        endpoint = "genre/movie/list" if media_type == "movie" else "genre/tv/list"
-        data = self._request(endpoint)
-        if not data or not data.get("genres"):
-            return None
-        return {genre["id"]: genre["name"] for genre in data["genres"]}
+        names = self._genre_map(media_type)
+        return dict(names) if names is not None else None
     
     def _format_movie_results(self, results: List[Dict[str, object]]) -> List[Dict[str, object]]:
         """Format movie results with standard fields."""
-        formatted = []
-        for movie in results:
-            formatted_movie = {
+        build_image = self._build_image
+        return [
+            {
                 "id": movie.get("id"),
                 "title": movie.get("title", ""),
                 "original_title": movie.get("original_title"),
                 "overview": movie.get("overview", ""),
                 "release_date": movie.get("release_date"),
-                "poster_path": self._build_image(movie.get("poster_path"), _TMDb_POSTER_SIZE),
-                "backdrop_path": self._build_image(movie.get("backdrop_path"), _TMDb_FANART_SIZE),
+                "poster_path": build_image(movie.get("poster_path"), _TMDb_POSTER_SIZE),
+                "backdrop_path": build_image(movie.get("backdrop_path"), _TMDb_FANART_SIZE),
                 "vote_average": movie.get("vote_average", 0),
                 "vote_count": movie.get("vote_count", 0),
                 "popularity": movie.get("popularity", 0),
-                "media_type": "movie"
+                "media_type": "movie",
+                "year": _release_year(movie),
             }
-            # Extract year from release date
-            if formatted_movie["release_date"]:
-                try:
-                    formatted_movie["year"] = int(formatted_movie["release_date"].split("-")[0])
-                except (ValueError, AttributeError):
-                    formatted_movie["year"] = None
-            formatted.append(formatted_movie)
-        return formatted
+            for movie in results
+        ]
     
     def _format_tv_results(self, results: List[Dict[str, object]]) -> List[Dict[str, object]]:
         """Format TV show results with standard fields."""
-        formatted = []
-        for show in results:
-            formatted_show = {
+        build_image = self._build_image
+        return [
+            {
                 "id": show.get("id"),
                 "name": show.get("name", ""),
                 "title": show.get("name", ""),  # For compatibility
                 "original_name": show.get("original_name"),
                 "overview": show.get("overview", ""),
                 "first_air_date": show.get("first_air_date"),
-                "poster_path": self._build_image(show.get("poster_path"), _TMDb_POSTER_SIZE),
-                "backdrop_path": self._build_image(show.get("backdrop_path"), _TMDb_FANART_SIZE),
+                "poster_path": build_image(show.get("poster_path"), _TMDb_POSTER_SIZE),
+                "backdrop_path": build_image(show.get("backdrop_path"), _TMDb_FANART_SIZE),
                 "vote_average": show.get("vote_average", 0),
                 "vote_count": show.get("vote_count", 0),
                 "popularity": show.get("popularity", 0),
-                "media_type": "tvshow"
+                "media_type": "tvshow",
+                "year": _release_year(show),
             }
-            # Extract year from first air date
-            if formatted_show["first_air_date"]:
-                try:
-                    formatted_show["year"] = int(formatted_show["first_air_date"].split("-")[0])
-                except (ValueError, AttributeError):
-                    formatted_show["year"] = None
-            formatted.append(formatted_show)
-        return formatted
-
+            for show in results
+        ]
 
 class CSFDMetadataProvider(MetadataProvider):
     name = "csfd"
 
     _SECTION_TEMPLATE = r'<section class="main-box" data-search-results="{kind}".*?<div id="snippet--container[^>]+>(?P<body>.*?)</section>'
-    _ARTICLE_RE = re.compile(r"<article class=\"article[\s\S]*?<\/article>")
+    # enrich() only ever searches these two result sections
+    _SECTION_RES = {
+        "films": re.compile(_SECTION_TEMPLATE.format(kind="films"), re.S),
+        "series": re.compile(_SECTION_TEMPLATE.format(kind="series"), re.S),
+    }
+    # First result article, located with str.find instead of a lazy [\s\S]*? scan
+    _ARTICLE_START = '<article class="article'
+    _ARTICLE_END = "</article>"
     _TITLE_RE = re.compile(r'class="film-title-name">([^<]+)</a>')
     _HREF_RE = re.compile(r'<a href="(/(?:film|serial)/[^"]+)"')
     _YEAR_RE = re.compile(r'<span class="info">\((\d{4})\)</span>')
@@ -459,42 +563,115 @@ class CSFDMetadataProvider(MetadataProvider):
     _ORIGIN_RE = re.compile(r'<div class="origin">([^<]+)</div>')
     _JSONLD_RE = re.compile(r'<script type="application/ld\+json">([^<]+)</script>')
     _PLOT_RE = re.compile(r'<div class="plot-preview">([\s\S]*?)</div>')
+    _DETAIL_GENRES_RE = re.compile(r'<div class="genres">([\s\S]*?)</div>')
+    _ORIGIN_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+    _TAG_RE = re.compile(r"<[^>]+>")
+    _WHITESPACE_RE = re.compile(r"\s+")
+    # Enhanced TV series detection patterns
+    _SERIES_PATTERNS = (
+        # Direct serial URLs
+        (re.compile(r'<a href="(/serial/[^"]+)"[^>]*>.*?class="film-title-name">([^<]+)</a>', re.DOTALL | re.IGNORECASE), "serial"),
+        # TV series under film URLs (some series are classified as films)
+        (re.compile(r'<a href="(/film/[^"]+)"[^>]*>.*?class="film-title-name">([^<]+)</a>.*?(?:seriál|TV seriál)', re.DOTALL | re.IGNORECASE), "film-serial"),
+        # Series with explicit type indication
+        (re.compile(r'<a href="(/film/[^"]+)"[^>]*>.*?<span[^>]*>([^<]+)</span>.*?(?:série|season)', re.DOTALL | re.IGNORECASE), "film-series"),
+    )
+    _ANY_TITLE_LINK_RE = re.compile(r'<a href="(/(?:film|serial)/[^"]+)"[^>]*>.*?class="film-title-name">([^<]+)</a>', re.DOTALL)
+    # Series page: year range, and one pass over all three kinds of season
+    # evidence (navigation links, "Série N" text, S01E02 codes). A link match
+    # swallows the "Série N" or code text inside it, so only the link group
+    # equals a separate findall(); the other two differ only when a link
+    # matched, and then the links win and those groups are never read.
+    _SERIES_YEAR_RE = re.compile(r'<span class="info">\((\d{4})[-–]?(\d{4})?\)</span>')
+    _SEASON_EVIDENCE_RE = re.compile(
+        r'<a[^>]*href="[^"]*serie-\d+[^"]*"[^>]*>.*?Série\s*(?P<link>\d+)'
+        r'|(?:Série|Season)\s*(?P<text>\d+)'
+        r'|S(?P<code_season>\d+)E(?P<code_episode>\d+)',
+        re.IGNORECASE,
+    )
+    # Any of these near the top of a page marks it as a series ("TV seriál" is covered by "seriál")
+    _SERIES_INDICATOR_RE = re.compile(r"seriál|série|season|episode|epizoda|S0[1-3]E", re.IGNORECASE)
 
-    def __init__(self, user_agent: str, logger):
-        self._session = requests.Session()
-        # Use better headers based on the working ČSFD scraper
-        self._session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Safari/537.36"
-        })
+    # Use better headers based on the working ČSFD scraper; sent per request
+    # rather than set on the session, which MetadataManager shares with TMDb
+    _HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Safari/537.36"
+    }
+    _SEARCH_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'cs,en-US;q=0.7,en;q=0.3'
+    }
+
+    # Page bodies remembered by URL; series lookups revisit the same pages
+    PAGE_CACHE_SIZE = 128
+
+    def __init__(self, user_agent: str, logger, session: Optional[requests.Session] = None):
+        self._session = session or _pooled_session()
         self._logger = logger
+        self._page_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._page_lock = threading.Lock()
 
     def _strip_tags(self, html: str) -> str:
-        return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", "", html)).strip()
+        return self._WHITESPACE_RE.sub(" ", self._TAG_RE.sub("", html)).strip()
+
+    def _get_page(self, url: str, timeout: int = 12) -> str:
+        """Return the body of ``url``, from the page cache when possible.
+
+        Raises ``requests.RequestException`` on failure; errors are not cached.
+        """
+        with self._page_lock:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                self._page_cache.move_to_end(url)
+                return cached
+        response = self._session.get(url, timeout=timeout, headers=self._HEADERS)
+        response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        text = response.text
+        with self._page_lock:
+            self._page_cache[url] = text
+            self._page_cache.move_to_end(url)
+            while len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return text
+
+    def _get_page_prefix(self, url: str, chars: int, timeout: int = 12) -> str:
+        """Return the first ``chars`` characters of ``url``, closing the stream after them."""
+        with self._page_lock:
+            cached = self._page_cache.get(url)
+        if cached is not None:
+            return cached[:chars]
+        with self._session.get(url, timeout=timeout, headers=self._HEADERS, stream=True) as response:
+            response.raise_for_status()
+            # Four bytes per character is enough for any UTF-8 text
+            head = response.raw.read(chars * 4, decode_content=True)
+            return head.decode(response.encoding or "utf-8", errors="ignore")[:chars]
 
     def _fetch(self, url: str) -> Optional[str]:
         try:
-            response = self._session.get(url, timeout=12)
-            response.raise_for_status()
-            response.encoding = response.encoding or "utf-8"
-            return response.text
+            return self._get_page(url)
         except requests.RequestException as exc:
             self._logger(f"ČSFD request failed: {exc}", xbmc.LOGWARNING)
             return None
 
     def _search(self, query: str, kind: str) -> Optional[Dict[str, object]]:
-        url = f"https://www.csfd.cz/hledat/?q={requests.utils.quote(query)}"
+        url = f"https://www.csfd.cz/hledat/?q={quote(query, safe='')}"
         html = self._fetch(url)
         if not html:
             return None
-        section_re = re.compile(self._SECTION_TEMPLATE.format(kind=kind), re.S)
+        section_re = self._SECTION_RES.get(kind) or re.compile(self._SECTION_TEMPLATE.format(kind=kind), re.S)
         section_match = section_re.search(html)
         if not section_match:
             return None
         section_body = section_match.group("body")
-        article_match = self._ARTICLE_RE.search(section_body)
-        if not article_match:
+        start = section_body.find(self._ARTICLE_START)
+        if start < 0:
+            return None
+        end = section_body.find(self._ARTICLE_END, start)
+        if end < 0:
             return None
-        article = article_match.group(0)
+        article = section_body[start : end + len(self._ARTICLE_END)]
         title_match = self._TITLE_RE.search(article)
         href_match = self._HREF_RE.search(article)
         if not title_match or not href_match:
@@ -560,7 +737,7 @@ class CSFDMetadataProvider(MetadataProvider):
             origin_text = self._strip_tags(origin_match.group(1))
             result["origin"] = origin_text
             if "year" not in result:
-                years = re.findall(r"(19|20)\d{2}", origin_text)
+                years = self._ORIGIN_YEAR_RE.findall(origin_text)
                 if years:
                     try:
                         result["year"] = int(years[0])
@@ -569,14 +746,14 @@ class CSFDMetadataProvider(MetadataProvider):
         plot_match = self._PLOT_RE.search(html)
         if plot_match:
             result["plot"] = self._strip_tags(plot_match.group(1))
-        genres_section = re.search(r'<div class="genres">([\s\S]*?)</div>', html)
+        genres_section = self._DETAIL_GENRES_RE.search(html)
         if genres_section:
             raw = self._strip_tags(genres_section.group(1))
             genres = [part.strip() for part in raw.split("/") if part.strip()]
             result["genres"] = genres
         return result
 
-    def enrich(self, item: MediaItem) -> Optional[Dict[str, object]]:
+    def enrich(self, item: MediaItem, detailed: bool = False) -> Optional[Dict[str, object]]:
         kind = "films" if item.media_type == "movie" else "series"
         candidate = self._search(item.cleaned_title, kind)
         if not candidate:
@@ -602,11 +779,10 @@ class CSFDMetadataProvider(MetadataProvider):
     
     def search_tv_series(self, series_name: str) -> Optional[Dict[str, object]]:
         """Search for TV series on ČSFD with enhanced detection patterns."""
-        from .title_mapping import CZECH_TO_ENGLISH_MAPPING
-        
         # Try both original and English name
-        search_terms = [series_name.lower()]
-        english_title = CZECH_TO_ENGLISH_MAPPING.get(series_name.lower())
+        series_key = series_name.lower()
+        search_terms = [series_key]
+        english_title = CZECH_TO_ENGLISH_MAPPING.get(series_key)
         if english_title:
             search_terms.append(english_title)
         
@@ -614,31 +790,15 @@ class CSFDMetadataProvider(MetadataProvider):
             self._logger(f"Searching ČSFD for TV series: '{search_term}'", xbmc.LOGINFO)
             
             # Search for series on ČSFD
-            search_url = f"https://www.csfd.cz/hledat/?q={requests.utils.quote(search_term)}"
+            search_url = f"https://www.csfd.cz/hledat/?q={quote(search_term, safe='')}"
             
             try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'cs,en-US;q=0.7,en;q=0.3'
-                }
-                
-                response = self._session.get(search_url, headers=headers, timeout=10)
+                response = self._session.get(search_url, headers=self._SEARCH_HEADERS, timeout=10)
                 response.raise_for_status()
                 content = response.text
                 
-                # Enhanced TV series detection patterns
-                series_patterns = [
-                    # Direct serial URLs
-                    (r'<a href="(/serial/[^"]+)"[^>]*>.*?class="film-title-name">([^<]+)</a>', "serial"),
-                    # TV series under film URLs (some series are classified as films)
-                    (r'<a href="(/film/[^"]+)"[^>]*>.*?class="film-title-name">([^<]+)</a>.*?(?:seriál|TV seriál)', "film-serial"),
-                    # Series with explicit type indication
-                    (r'<a href="(/film/[^"]+)"[^>]*>.*?<span[^>]*>([^<]+)</span>.*?(?:série|season)', "film-series")
-                ]
-                
-                for pattern, pattern_type in series_patterns:
-                    series_match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+                for pattern, pattern_type in self._SERIES_PATTERNS:
+                    series_match = pattern.search(content)
                     if series_match:
                         series_url = "https://www.csfd.cz" + series_match.group(1)
                         series_title = series_match.group(2).strip()
@@ -655,7 +815,7 @@ class CSFDMetadataProvider(MetadataProvider):
                     self._logger(f"Trying broader match for '{search_term}'", xbmc.LOGINFO)
                     
                     # Look for any film/serial that might be a TV show
-                    all_matches = re.findall(r'<a href="(/(?:film|serial)/[^"]+)"[^>]*>.*?class="film-title-name">([^<]+)</a>', content, re.DOTALL)
+                    all_matches = self._ANY_TITLE_LINK_RE.findall(content)
                     
                     for url_path, title in all_matches[:3]:  # Try first 3 results
                         series_url = "https://www.csfd.cz" + url_path
@@ -680,22 +840,13 @@ class CSFDMetadataProvider(MetadataProvider):
                 return False
             
             # Quick page check for series indicators
-            response = self._session.get(url, timeout=5)
-            if response.status_code != 200:
-                return False
-                
-            content = response.text[:2000]  # Just check beginning of page
+            content = self._get_page_prefix(url, 2000, timeout=5)  # Just check beginning of page
             
             # Look for series indicators
-            series_indicators = [
-                'seriál', 'série', 'season', 'episode', 'epizoda',
-                'S01E', 'S02E', 'S03E', 'TV seriál'
-            ]
-            
-            for indicator in series_indicators:
-                if indicator.lower() in content.lower():
-                    self._logger(f"Found series indicator '{indicator}' for {title}", xbmc.LOGINFO)
-                    return True
+            indicator_match = self._SERIES_INDICATOR_RE.search(content)
+            if indicator_match:
+                self._logger(f"Found series indicator '{indicator_match.group(0)}' for {title}", xbmc.LOGINFO)
+                return True
             
             return False
             
@@ -705,22 +856,30 @@ class CSFDMetadataProvider(MetadataProvider):
     def _get_series_details(self, series_url: str, series_title: str) -> Optional[Dict[str, object]]:
         """Get detailed information about a TV series from ČSFD with enhanced structure detection."""
         try:
-            response = self._session.get(series_url, timeout=10)
-            response.raise_for_status()
-            content = response.text
+            content = self._get_page(series_url, timeout=10)
             
             # Extract basic info
-            year_match = re.search(r'<span class="info">\((\d{4})[-–]?(\d{4})?\)</span>', content)
-            plot_match = re.search(r'<div class="plot-preview">(.*?)</div>', content, re.DOTALL)
+            year_match = self._SERIES_YEAR_RE.search(content)
+            plot_match = self._PLOT_RE.search(content)
             
             # Enhanced season detection - ČSFD structure analysis
             seasons = []
             
+            season_links: List[str] = []
+            season_text_matches: List[str] = []
+            episode_codes: List[Tuple[str, str]] = []
+            for match in self._SEASON_EVIDENCE_RE.finditer(content):
+                if match.group("link") is not None:
+                    season_links.append(match.group("link"))
+                elif match.group("text") is not None:
+                    season_text_matches.append(match.group("text"))
+                else:
+                    episode_codes.append((match.group("code_season"), match.group("code_episode")))
+            
             # Method 1: Look for direct season links in navigation
-            season_links = re.findall(r'<a[^>]*href="[^"]*serie-(\d+)[^"]*"[^>]*>.*?Série\s*(\d+)', content, re.IGNORECASE)
             if season_links:
                 self._logger(f"Found {len(season_links)} seasons via navigation links", xbmc.LOGINFO)
-                for link_num, season_num in season_links:
+                for season_num in sorted(season_links, key=int):
                     seasons.append({
                         "season_number": int(season_num),
                         "episode_count": 0,  # Will be filled by episode detection
@@ -731,12 +890,12 @@ class CSFDMetadataProvider(MetadataProvider):
             
             # Method 2: Look for season information in structured data
             if not seasons:
-                season_text_matches = re.findall(r'(?:Série|Season)\s*(\d+)', content, re.IGNORECASE)
                 if season_text_matches:
-                    self._logger(f"Found {len(set(season_text_matches))} seasons via text analysis", xbmc.LOGINFO)
-                    for season_num in sorted(set(season_text_matches)):
+                    season_numbers = sorted({int(s) for s in season_text_matches})
+                    self._logger(f"Found {len(season_numbers)} seasons via text analysis", xbmc.LOGINFO)
+                    for season_num in season_numbers:
                         seasons.append({
-                            "season_number": int(season_num),
+                            "season_number": season_num,
                             "episode_count": 0,
                             "name": f"Série {season_num}",
                             "poster_path": None,
@@ -745,15 +904,13 @@ class CSFDMetadataProvider(MetadataProvider):
             
             # Method 3: Try to detect episodes and infer seasons from position codes
             if not seasons:
-                episode_codes = re.findall(r'S(\d+)E(\d+)', content, re.IGNORECASE)
                 if episode_codes:
-                    season_numbers = sorted(set(int(s) for s, e in episode_codes))
-                    self._logger(f"Found {len(season_numbers)} seasons via episode position codes", xbmc.LOGINFO)
-                    for season_num in season_numbers:
-                        episode_count = len([e for s, e in episode_codes if int(s) == season_num])
+                    episode_counts = Counter(int(s) for s, e in episode_codes)
+                    self._logger(f"Found {len(episode_counts)} seasons via episode position codes", xbmc.LOGINFO)
+                    for season_num in sorted(episode_counts):
                         seasons.append({
                             "season_number": season_num,
-                            "episode_count": episode_count,
+                            "episode_count": episode_counts[season_num],
                             "name": f"Série {season_num}",
                             "poster_path": None,
                             "air_date": None
@@ -770,10 +927,8 @@ class CSFDMetadataProvider(MetadataProvider):
                     "air_date": None
                 })
             
-            # Sort seasons by season number
-            seasons.sort(key=lambda x: x["season_number"])
-            
-            series_id = abs(hash(series_url)) % 10000  # Generate numeric ID from URL
+            # Numeric ID derived from the URL; stable across runs, unlike hash()
+            series_id = int.from_bytes(hashlib.blake2b(series_url.encode("utf-8"), digest_size=4).digest(), "big")
             
             self._logger(f"ČSFD series '{series_title}' has {len(seasons)} seasons", xbmc.LOGINFO)
             
@@ -804,19 +959,18 @@ class CSFDMetadataProvider(MetadataProvider):
             # Try to get season-specific page
             season_url = csfd_url.replace('/serial/', f'/serial/').rstrip('/') + f'/serie-{season_number}/'
             
-            response = self._session.get(season_url, timeout=10)
-            if response.status_code == 404:
+            try:
+                content = self._get_page(season_url, timeout=10)
+            except requests.HTTPError as exc:
+                if exc.response is None or exc.response.status_code != 404:
+                    raise
                 # Fallback to main series page
-                response = self._session.get(csfd_url, timeout=10)
-            
-            response.raise_for_status()
-            content = response.text
+                content = self._get_page(csfd_url, timeout=10)
             
             episodes = []
             
             # Look for episode listings with position codes
-            episode_pattern = r'S0?%dE(\d+)(?:[^>]*>([^<]+))?' % season_number
-            episode_matches = re.findall(episode_pattern, content, re.IGNORECASE)
+            episode_matches = _csfd_episode_re(season_number).findall(content)
             
             if episode_matches:
                 for episode_num, episode_title in episode_matches:
@@ -843,12 +997,51 @@ class CSFDMetadataProvider(MetadataProvider):
 class MetadataManager:
     """Coordinates metadata lookup across providers."""
 
+    # Provider lookups running at once in enrich_batch()
+    BATCH_WORKERS = _POOL_MAXSIZE
+    # Lookup results remembered per title; the least recently used go first
+    CACHE_SIZE = 2048
+    # Series searches and listing pages are also kept as home window properties
+    # so the next plugin invocation (e.g. search -> seasons) reuses them; a key
+    # index property bounds how many stay, oldest first
+    CALL_CACHE_SIZE = 32
+    SERIES_CACHE_TTL = 6 * 3600
+    LISTING_CACHE_TTL = 3600
+    _CALL_PROPERTY = "tvstreamcz.metadata"
+    # Provider methods forwarded by _call() to the first provider offering them
+    _DELEGATED = (
+        "search_tv_series",
+        "get_season_episodes",
+        "get_popular_movies",
+        "get_top_rated_movies",
+        "get_now_playing_movies",
+        "get_upcoming_movies",
+        "get_movies_by_genre",
+        "get_popular_tv_shows",
+        "get_top_rated_tv_shows",
+        "get_airing_today_tv_shows",
+        "get_on_the_air_tv_shows",
+        "get_tv_shows_by_genre",
+        "get_movies_by_year",
+        "get_tv_shows_by_year",
+        "get_genre_list",
+    )
+
     def __init__(self, settings, logger):
         self._logger = logger
         self._providers: List[MetadataProvider] = []
+        self._dispatch: Dict[str, List[Tuple[str, Callable]]] = {}
+        self._provider_pool: Optional[ThreadPoolExecutor] = None
         order = settings.metadata_provider
+        self._call_cache: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+        # Season discovery and batch enrichment use the manager from several threads
+        self._cache_lock = threading.Lock()
+        # Results depend on the provider order and language as well as the arguments
+        self._call_scope = f"{order}:{settings.metadata_language}:{settings.metadata_region}:"
         if order == "none":
             return
+        # One keep-alive pool for every provider
+        session = _pooled_session()
         desired: List[str]
         if order == "tmdb_first":
             desired = ["tmdb", "csfd"]
@@ -863,11 +1056,21 @@ class MetadataManager:
         for provider_name in desired:
             if provider_name == "tmdb" and settings.tmdb_api_key:
                 self._providers.append(
-                    TMDbMetadataProvider(settings.tmdb_api_key, settings.metadata_language, settings.metadata_region, logger)
+                    TMDbMetadataProvider(
+                        settings.tmdb_api_key, settings.metadata_language, settings.metadata_region, logger, session
+                    )
                 )
             elif provider_name == "csfd":
-                self._providers.append(CSFDMetadataProvider(settings.csfd_user_agent, logger))
-        self._cache: Dict[tuple, Optional[Dict[str, object]]] = {}
+                self._providers.append(CSFDMetadataProvider(settings.csfd_user_agent, logger, session))
+        # Bound once here so each call is a dict lookup instead of hasattr per provider
+        self._dispatch = {
+            name: [(provider.name, getattr(provider, name)) for provider in self._providers if hasattr(provider, name)]
+            for name in self._DELEGATED
+        }
+        if settings.metadata_parallel and len(self._providers) > 1:
+            # Sized so every enrich_batch() worker can query all providers at once
+            self._provider_pool = ThreadPoolExecutor(max_workers=self.BATCH_WORKERS * len(self._providers))
+        self._cache: "OrderedDict[tuple, Optional[Dict[str, object]]]" = OrderedDict()
 
     def has_providers(self) -> bool:
         return bool(self._providers)
@@ -879,195 +1082,207 @@ class MetadataManager:
                 return genres
         return None
 
-    def enrich(self, item: MediaItem) -> Optional[Dict[str, object]]:
-        cache_key = (item.media_type, item.cleaned_title.lower(), item.guessed_year, item.season)
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            if cached:
-                item.apply_metadata(cached)
-            return cached
-        metadata = None
+    def _cache_key(self, item: MediaItem, detailed: bool = False) -> tuple:
+        return (item.media_type, item.cleaned_title_lower, item.guessed_year, item.season, detailed)
+
+    def _remember(self, cache_key: tuple, metadata: Optional[Dict[str, object]]) -> None:
+        with self._cache_lock:
+            self._cache[cache_key] = metadata
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _recall(self, cache_key: tuple) -> Tuple[bool, Optional[Dict[str, object]]]:
+        with self._cache_lock:
+            if cache_key not in self._cache:
+                return False, None
+            self._cache.move_to_end(cache_key)
+            return True, self._cache[cache_key]
+
+    def _provider_enrich(
+        self, provider: MetadataProvider, item: MediaItem, detailed: bool
+    ) -> Optional[Dict[str, object]]:
+        try:
+            return provider.enrich(item, detailed)
+        except Exception as exc:  # noqa: broad-except to keep plugin resilient
+            self._logger(f"Metadata provider {provider.name} failed: {exc}", xbmc.LOGWARNING)
+            return None
+
+    def _lookup(self, item: MediaItem, detailed: bool = False) -> Optional[Dict[str, object]]:
+        if self._provider_pool is not None:
+            # All providers start at once; results are still taken in preference
+            # order, so a fallback provider only hides its latency, never wins early
+            futures = [
+                self._provider_pool.submit(self._provider_enrich, provider, item, detailed)
+                for provider in self._providers
+            ]
+            for future in futures:
+                metadata = future.result()
+                if metadata:
+                    return metadata
+            return None
         for provider in self._providers:
-            try:
-                metadata = provider.enrich(item)
-            except Exception as exc:  # noqa: broad-except to keep plugin resilient
-                self._logger(f"Metadata provider {provider.name} failed: {exc}", xbmc.LOGWARNING)
-                metadata = None
+            metadata = self._provider_enrich(provider, item, detailed)
             if metadata:
-                item.apply_metadata(metadata)
-                break
-        self._cache[cache_key] = metadata
+                return metadata
+        return None
+
+    def enrich(self, item: MediaItem, detailed: bool = False) -> Optional[Dict[str, object]]:
+        """Look up metadata for ``item``; ``detailed`` also fetches extras such as the IMDb id."""
+        cache_key = self._cache_key(item, detailed)
+        found, metadata = self._recall(cache_key)
+        if not found:
+            metadata = self._lookup(item, detailed)
+            self._remember(cache_key, metadata)
+        if metadata:
+            item.apply_metadata(metadata)
         return metadata
-    
+
+    def enrich_batch(self, items: Iterable[MediaItem]) -> None:
+        """Enrich ``items`` with one lookup per uncached title, run concurrently."""
+        keyed = [(self._cache_key(item), item) for item in items]
+        results: Dict[tuple, Optional[Dict[str, object]]] = {}
+        pending: Dict[tuple, MediaItem] = {}
+        for cache_key, item in keyed:
+            if cache_key in results or cache_key in pending:
+                continue
+            found, metadata = self._recall(cache_key)
+            if found:
+                results[cache_key] = metadata
+            else:
+                pending[cache_key] = item
+        if len(pending) == 1:
+            cache_key, item = next(iter(pending.items()))
+            results[cache_key] = self._lookup(item)
+        elif pending:
+            with ThreadPoolExecutor(max_workers=min(self.BATCH_WORKERS, len(pending))) as executor:
+                results.update(zip(pending, executor.map(self._lookup, pending.values())))
+        for cache_key in pending:
+            self._remember(cache_key, results[cache_key])
+        for cache_key, item in keyed:
+            metadata = results[cache_key]
+            if metadata:
+                item.apply_metadata(metadata)
+
+    def _call(self, name: str, *args):
+        """Return the first provider's result for ``name``, skipping providers that fail."""
+        for provider_name, method in self._dispatch.get(name, ()):
+            try:
+                return method(*args)
+            except Exception as exc:
+                self._logger(f"{name} failed for {provider_name}: {exc}", xbmc.LOGWARNING)
+        return None
+
+    def _cached_call(self, name: str, ttl: int, *args):
+        """``_call`` whose found results are reused for ``ttl`` seconds, also by later invocations."""
+        key = self._call_scope + name + ":" + ":".join(str(arg).strip().lower() for arg in args)
+        window = xbmcgui.Window(10000)
+        with self._cache_lock:
+            entry = self._call_cache.get(key)
+        if entry is None:
+            stored = window.getProperty(self._CALL_PROPERTY + "." + key)
+            if stored:
+                try:
+                    saved_at, result = json.loads(stored)
+                    entry = (float(saved_at), result)
+                except (ValueError, TypeError):
+                    entry = None
+        if entry is not None and time.time() - entry[0] <= ttl:
+            with self._cache_lock:
+                self._remember_call(key, entry)
+            return entry[1]
+        result = self._call(name, *args)
+        # Misses and failures are not remembered so they are retried next time
+        if not result:
+            return result
+        entry = (time.time(), result)
+        with self._cache_lock:
+            self._remember_call(key, entry)
+            self._store_call(window, key, entry)
+        return result
+
+    def _remember_call(self, key: str, entry: Tuple[float, object]) -> None:
+        self._call_cache[key] = entry
+        self._call_cache.move_to_end(key)
+        while len(self._call_cache) > self.CALL_CACHE_SIZE:
+            self._call_cache.popitem(last=False)
+
+    def _store_call(self, window, key: str, entry: Tuple[float, object]) -> None:
+        # Only the new entry and the short key index are written; the keys that
+        # fall off the index have their properties cleared
+        try:
+            stored = json.dumps(entry)
+        except (TypeError, ValueError):
+            return
+        try:
+            keys = json.loads(window.getProperty(self._CALL_PROPERTY) or "[]")
+        except ValueError:
+            keys = []
+        if key in keys:
+            keys.remove(key)
+        keys.append(key)
+        for evicted in keys[:-self.CALL_CACHE_SIZE]:
+            window.clearProperty(self._CALL_PROPERTY + "." + evicted)
+        del keys[:-self.CALL_CACHE_SIZE]
+        window.setProperty(self._CALL_PROPERTY + "." + key, stored)
+        window.setProperty(self._CALL_PROPERTY, json.dumps(keys))
+
     def search_tv_series(self, series_name: str) -> Optional[Dict[str, object]]:
         """Search for TV series metadata including season information."""
-        if not self.has_providers():
-            return None
-            
-        for provider in self._providers:
-            if hasattr(provider, 'search_tv_series'):
-                try:
-                    return provider.search_tv_series(series_name)
-                except Exception as exc:
-                    self._logger(f"TV series search failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("search_tv_series", self.SERIES_CACHE_TTL, series_name)
+
     def get_season_episodes(self, series_id: int, season_number: int) -> Optional[List[Dict[str, object]]]:
         """Get episodes for a specific season."""
-        if not self.has_providers():
-            return None
-            
-        for provider in self._providers:
-            if hasattr(provider, 'get_season_episodes'):
-                try:
-                    return provider.get_season_episodes(series_id, season_number)
-                except Exception as exc:
-                    self._logger(f"Season episodes fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
-    # Movie category methods
+        return self._call("get_season_episodes", series_id, season_number)
+
     def get_popular_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get popular movies."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_popular_movies'):
-                try:
-                    return provider.get_popular_movies(page)
-                except Exception as exc:
-                    self._logger(f"Popular movies fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_popular_movies", self.LISTING_CACHE_TTL, page)
+
     def get_top_rated_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get top rated movies."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_top_rated_movies'):
-                try:
-                    return provider.get_top_rated_movies(page)
-                except Exception as exc:
-                    self._logger(f"Top rated movies fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_top_rated_movies", self.LISTING_CACHE_TTL, page)
+
     def get_now_playing_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get movies currently in theaters."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_now_playing_movies'):
-                try:
-                    return provider.get_now_playing_movies(page)
-                except Exception as exc:
-                    self._logger(f"Now playing movies fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_now_playing_movies", self.LISTING_CACHE_TTL, page)
+
     def get_upcoming_movies(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get upcoming movies."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_upcoming_movies'):
-                try:
-                    return provider.get_upcoming_movies(page)
-                except Exception as exc:
-                    self._logger(f"Upcoming movies fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_upcoming_movies", self.LISTING_CACHE_TTL, page)
+
     def get_movies_by_genre(self, genre_id: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get movies by genre."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_movies_by_genre'):
-                try:
-                    return provider.get_movies_by_genre(genre_id, page)
-                except Exception as exc:
-                    self._logger(f"Movies by genre fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
-    # TV Show category methods
+        return self._cached_call("get_movies_by_genre", self.LISTING_CACHE_TTL, genre_id, page)
+
     def get_popular_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get popular TV shows."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_popular_tv_shows'):
-                try:
-                    return provider.get_popular_tv_shows(page)
-                except Exception as exc:
-                    self._logger(f"Popular TV shows fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_popular_tv_shows", self.LISTING_CACHE_TTL, page)
+
     def get_top_rated_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get top rated TV shows."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_top_rated_tv_shows'):
-                try:
-                    return provider.get_top_rated_tv_shows(page)
-                except Exception as exc:
-                    self._logger(f"Top rated TV shows fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_top_rated_tv_shows", self.LISTING_CACHE_TTL, page)
+
     def get_airing_today_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows airing today."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_airing_today_tv_shows'):
-                try:
-                    return provider.get_airing_today_tv_shows(page)
-                except Exception as exc:
-                    self._logger(f"Airing today TV shows fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_airing_today_tv_shows", self.LISTING_CACHE_TTL, page)
+
     def get_on_the_air_tv_shows(self, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows currently on the air."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_on_the_air_tv_shows'):
-                try:
-                    return provider.get_on_the_air_tv_shows(page)
-                except Exception as exc:
-                    self._logger(f"On the air TV shows fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
-    
+        return self._cached_call("get_on_the_air_tv_shows", self.LISTING_CACHE_TTL, page)
+
     def get_tv_shows_by_genre(self, genre_id: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows by genre."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_tv_shows_by_genre'):
-                try:
-                    return provider.get_tv_shows_by_genre(genre_id, page)
-                except Exception as exc:
-                    self._logger(f"TV shows by genre fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
+        return self._cached_call("get_tv_shows_by_genre", self.LISTING_CACHE_TTL, genre_id, page)
 
     def get_movies_by_year(self, year: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get movies by release year."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_movies_by_year'):
-                try:
-                    return provider.get_movies_by_year(year, page)
-                except Exception as exc:
-                    self._logger(f"Movies by year fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
+        return self._cached_call("get_movies_by_year", self.LISTING_CACHE_TTL, year, page)
 
     def get_tv_shows_by_year(self, year: int, page: int = 1) -> Optional[List[Dict[str, object]]]:
         """Get TV shows by first air year."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_tv_shows_by_year'):
-                try:
-                    return provider.get_tv_shows_by_year(year, page)
-                except Exception as exc:
-                    self._logger(f"TV shows by year fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
+        return self._cached_call("get_tv_shows_by_year", self.LISTING_CACHE_TTL, year, page)
 
     def get_genre_list(self, media_type: str) -> Optional[Dict[int, str]]:
         """Get list of genres with IDs."""
-        for provider in self._providers:
-            if hasattr(provider, 'get_genre_list'):
-                try:
-                    return provider.get_genre_list(media_type)
-                except Exception as exc:
-                    self._logger(f"Genre list fetch failed for {provider.name}: {exc}", xbmc.LOGWARNING)
-                    continue
-        return None
+        return self._call("get_genre_list", media_type)
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Dict, List, Optional, Pattern, Tuple
 
 _TOKEN_SPLIT = re.compile(r"[\s._\-\[\](){}]+")
@@ -14,22 +15,68 @@ _QUALITY_PATTERNS = (
     ("hd", re.compile(r"(?i)(1080p|720p|hd|webrip|bluray|bdrip|brrip)"), 2),
     ("sd", re.compile(r"(?i)(576p|480p|dvdrip|dvd|tvrip|xvid|hdtv|cam|workprint|ts)") , 1),
 )
+# Matched against the lower-cased, space-joined tokens of a name
 _LANGUAGE_MAP: Dict[str, Pattern[str]] = {
-    "cz": re.compile(r"(?i)\b(cz|ces|cze|czech|czdab|czdub|czaudio|czsound|cz\s*dabing|cz\s*dub)\b"),
-    "sk": re.compile(r"(?i)\b(sk|slk|slovak|skdab|skdub|sk\s*dabing|sk\s*dub)\b"),
-    "en": re.compile(r"(?i)\b(en|eng|english|en\s*audio)\b"),
+    "cz": re.compile(r"\b(cz|ces|cze|czech|czdab|czdub|czaudio|czsound|cz\s*dabing|cz\s*dub)\b"),
+    "sk": re.compile(r"\b(sk|slk|slovak|skdab|skdub|sk\s*dabing|sk\s*dub)\b"),
+    "en": re.compile(r"\b(en|eng|english|en\s*audio)\b"),
 }
 _SUBTITLE_MAP: Dict[str, Pattern[str]] = {
-    "cz": re.compile(r"(?i)(cz\s*tit|tit\s*cz|cz\s*subs|czsub|cztitl|cztitulky)"),
-    "sk": re.compile(r"(?i)(sk\s*tit|tit\s*sk|sk\s*subs|sktit|sktitulky)"),
-    "en": re.compile(r"(?i)(en\s*tit|tit\s*en|en\s*subs|engsub|eng\s*subs|english\s*subs)"),
+    "cz": re.compile(r"(cz\s*tit|tit\s*cz|cz\s*subs|czsub|cztitl|cztitulky)"),
+    "sk": re.compile(r"(sk\s*tit|tit\s*sk|sk\s*subs|sktit|sktitulky)"),
+    "en": re.compile(r"(en\s*tit|tit\s*en|en\s*subs|engsub|eng\s*subs|english\s*subs)"),
 }
 _REMOVE_TOKENS = re.compile(
     r"(?i)\b(720p|1080p|2160p|4k|uhd|hdr|webrip|web-dl|webdl|bluray|bdrip|brrip|x264|x265|h264|h265|hevc|dvdrip|dvdr|hdtv|aac|dts|truehd|atmos|remux|multi|cz|sk|eng|en|dd5\.?1|dd\d|exclusive|proper|repack|nf|nfwebrip|ws|hmax|amzn|pal|ntsc)\b"
 )
+_PART_OF_RE = re.compile(r"\b\d{1,2}of\d{1,2}\b", re.IGNORECASE)
+# clean_title() passes, in order; each one can expose a marker to the next
+# (e.g. "S01 CZ E05" only matches once "CZ" is gone), so they stay separate
+_CLEAN_PASSES = (_REMOVE_TOKENS, _SEASON_EPISODE_RE, _ALT_SEASON_EPISODE_RE, _YEAR_RE, _PART_OF_RE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCT_TRANS = str.maketrans({"_": " ", ".": " ", "-": " "})
 _ARTICLES = ("the ", "a ", "an ", "der ", "die ", "das ", "le ", "la ", "los ", "las ", "el ")
+# Extended TV show markers, folded into one alternation so a name is scanned once
+_TV_PATTERNS_RE = re.compile(
+    "|".join(
+        (
+            r"[Ss]\d{1,2}[Ee]\d{1,2}",  # S01E01, s1e1
+            r"\d+x\d+",                  # 1x01, 2x05
+            r"[Ss]ér[ií]e?\s*\d+",      # Série 1, serie 1, sérii 1
+            r"[Ss]eason\s*\d+",         # Season 1
+            r"[Ee]p\.?\s*\d+",          # Ep.1, Episode 1
+            r"[Ee]pisode\s*\d+",        # Episode 1
+            r"\b[Ss]\d{1,2}\b",         # S1, S01 (standalone)
+            r"\b[Ee]\d{1,2}\b",         # E1, E01 (standalone)
+            r"díl\s*\d+",               # díl 1, díl 12
+            r"část\s*\d+",              # část 1
+        )
+    ),
+    re.IGNORECASE,
+)
+_TRAILER_RE = re.compile(
+    r"(trailer|teaser|sample|preview|promo|making[\s_-]?of|behind[\s_-]?the[\s_-]?scenes|extras?|bonus|featurette|deleted[\s_-]?scene|outtake|interview|soundtrack|ost|music[\s_-]?video|documentary|doc|featureset|commercial|ad)",
+    re.IGNORECASE,
+)
+_SHORT_CLIP_RE = re.compile(r"\b(clip|short|segment|excerpt|fragment|demo|test|rip)\b", re.IGNORECASE)
+_NON_CONTENT_RE = re.compile(r"\b(readme|nfo|txt|sub|srt|idx|info|cover|artwork|poster)\b", re.IGNORECASE)
+_PART_RE = re.compile(r"(part\d+|cd\d+|disc\d+|\bpt\d+)", re.IGNORECASE)
+_MOVIE_HINT_RE = re.compile(r"(movie|film)", re.IGNORECASE)
+
 
+def _with_slots(cls):
+    """Rebuild dataclass ``cls`` with ``__slots__`` (``slots=True`` needs Python 3.10)."""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
+
+@_with_slots
 @dataclass
 class MediaItem:
     """Normalized representation of a Webshare media entry."""
@@ -55,6 +102,15 @@ class MediaItem:
     audio_languages: List[str] = field(default_factory=list)
     subtitle_languages: List[str] = field(default_factory=list)
     metadata: Dict[str, object] = field(default_factory=dict)
+    # Lower-cased forms reused by the filters and metadata lookups
+    cleaned_title_lower: str = field(init=False, repr=False, compare=False)
+    original_name_lower: str = field(init=False, repr=False, compare=False)
+    sort_title_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.cleaned_title_lower = self.cleaned_title.lower()
+        self.original_name_lower = self.original_name.lower()
+        self.sort_title_lower = self.sort_title.lower()
 
     def apply_metadata(self, data: Dict[str, object]) -> None:
         """Merge fetched metadata into the item."""
@@ -97,28 +153,15 @@ def detect_quality(name: str) -> Tuple[Optional[str], int]:
     return best, score
 
 
-def detect_languages(tokens: List[str], combined: str, patterns: Dict[str, Pattern[str]]) -> List[str]:
-    found: List[str] = []
-    lower_combined = combined.lower()
-    for lang, pattern in patterns.items():
-        if pattern.search(lower_combined):
-            found.append(lang)
-            continue
-        for token in tokens:
-            if pattern.search(token.lower()):
-                found.append(lang)
-                break
-    return found
+def detect_languages(combined_lower: str, patterns: Dict[str, Pattern[str]]) -> List[str]:
+    return [lang for lang, pattern in patterns.items() if pattern.search(combined_lower)]
 
 
 def clean_title(name: str) -> str:
-    work = name.replace("_", " ").replace(".", " ").replace("-", " ")
-    work = _REMOVE_TOKENS.sub(" ", work)
-    work = _SEASON_EPISODE_RE.sub(" ", work)
-    work = _ALT_SEASON_EPISODE_RE.sub(" ", work)
-    work = _YEAR_RE.sub(" ", work)
-    work = re.sub(r"\b\d{1,2}of\d{1,2}\b", " ", work, flags=re.I)
-    work = re.sub(r"\s+", " ", work).strip()
+    work = name.translate(_PUNCT_TRANS)
+    for pattern in _CLEAN_PASSES:
+        work = pattern.sub(" ", work)
+    work = _WHITESPACE_RE.sub(" ", work).strip()
     return work or name
 
 
@@ -132,50 +175,62 @@ def make_sort_title(title: str) -> str:
 
 def classify_media_type(name: str) -> str:
     """Classify media type with comprehensive TV show detection."""
-    
+
     # Check for explicit season/episode patterns first
-    season, episode = detect_season_episode(name)
-    if season is not None or episode is not None:
+    if _SEASON_EPISODE_RE.search(name) or _TV_PATTERNS_RE.search(name):
         return "tvshow"
-    
-    # Extended TV show patterns
-    tv_patterns = [
-        r"[Ss]\d{1,2}[Ee]\d{1,2}",  # S01E01, s1e1
-        r"\d+x\d+",                  # 1x01, 2x05
-        r"[Ss]ér[ií]e?\s*\d+",      # Série 1, serie 1, sérii 1
-        r"[Ss]eason\s*\d+",         # Season 1
-        r"[Ee]p\.?\s*\d+",          # Ep.1, Episode 1
-        r"[Ee]pisode\s*\d+",        # Episode 1
-        r"\b[Ss]\d{1,2}\b",         # S1, S01 (standalone)
-        r"\b[Ee]\d{1,2}\b",         # E1, E01 (standalone)
-        r"díl\s*\d+",               # díl 1, díl 12
-        r"část\s*\d+",              # část 1
-    ]
-    
-    # Check all TV patterns
-    for pattern in tv_patterns:
-        if re.search(pattern, name, re.IGNORECASE):
-            return "tvshow"
-    
+
     # Filter out trailers, samples, and other non-movie content
-    if re.search(r"(?i)(trailer|teaser|sample|preview|promo|making[\s_-]?of|behind[\s_-]?the[\s_-]?scenes|extras?|bonus|featurette|deleted[\s_-]?scene|outtake|interview|soundtrack|ost|music[\s_-]?video|documentary|doc|featureset|commercial|ad)", name):
+    if _TRAILER_RE.search(name):
         return "other"
-    
+
     # Additional filtering for short clips (likely not full movies)
-    if re.search(r"(?i)\b(clip|short|segment|excerpt|fragment|demo|test|rip)\b", name):
+    if _SHORT_CLIP_RE.search(name):
         return "other"
-    
+
     # Filter out obvious non-content files
-    if re.search(r"(?i)\b(readme|nfo|txt|sub|srt|idx|info|cover|artwork|poster)\b", name):
+    if _NON_CONTENT_RE.search(name):
         return "other"
-    
+
     # Filter out partial downloads or incomplete files
-    if re.search(r"(?i)(part\d+|cd\d+|disc\d+|\bpt\d+)", name) and not re.search(r"(?i)(movie|film)", name):
+    if _PART_RE.search(name) and not _MOVIE_HINT_RE.search(name):
         return "other"
-        
+
     return "movie"
 
 
+@lru_cache(maxsize=4096)
+def _analyse_name(name: str) -> tuple:
+    """Run the regex pipeline for ``name`` once; repeated names hit the cache.
+
+    Only immutable values are returned so the cached tuple can be shared
+    safely; ``parse_media_entry`` still builds a fresh ``MediaItem``.
+    """
+    media_type = classify_media_type(name)
+    season, episode = detect_season_episode(name)
+    guessed_year = detect_year(name)
+    quality, quality_score = detect_quality(name)
+
+    combined_lower = " ".join(tokenize(name)).lower()
+    audio_languages = tuple(detect_languages(combined_lower, _LANGUAGE_MAP))
+    subtitle_languages = tuple(detect_languages(combined_lower, _SUBTITLE_MAP))
+
+    cleaned = clean_title(name)
+    sort_title = make_sort_title(cleaned)
+    return (
+        media_type,
+        season,
+        episode,
+        guessed_year,
+        quality,
+        quality_score,
+        audio_languages,
+        subtitle_languages,
+        cleaned,
+        sort_title,
+    )
+
+
 def parse_media_entry(data: Dict[str, str], logger=None) -> MediaItem:
     name = data.get("name", "").strip()
     ident = data.get("ident", "").strip()
@@ -188,22 +243,22 @@ def parse_media_entry(data: Dict[str, str], logger=None) -> MediaItem:
     votes_negative = int(data.get("negative_votes", "0")) if data.get("negative_votes") else None
     password_protected = data.get("password", "0") == "1"
 
-    media_type = classify_media_type(name)
-    season, episode = detect_season_episode(name)
-    
+    (
+        media_type,
+        season,
+        episode,
+        guessed_year,
+        quality,
+        quality_score,
+        audio_languages,
+        subtitle_languages,
+        cleaned,
+        sort_title,
+    ) = _analyse_name(name)
+
     # Debug logging if available
     if logger and media_type == "tvshow":
         logger(f"TV SHOW detected: '{name}' -> {media_type}, S{season}E{episode}", level=2)  # LOGINFO
-    guessed_year = detect_year(name)
-    quality, quality_score = detect_quality(name)
-
-    tokens = tokenize(name)
-    combined = " ".join(tokens)
-    audio_languages = detect_languages(tokens, combined, _LANGUAGE_MAP)
-    subtitle_languages = detect_languages(tokens, combined, _SUBTITLE_MAP)
-
-    cleaned = clean_title(name)
-    sort_title = make_sort_title(cleaned)
 
     return MediaItem(
         ident=ident,
@@ -224,6 +279,6 @@ def parse_media_entry(data: Dict[str, str], logger=None) -> MediaItem:
         episode=episode,
         quality=quality,
         quality_score=quality_score,
-        audio_languages=audio_languages,
-        subtitle_languages=subtitle_languages,
+        audio_languages=list(audio_languages),
+        subtitle_languages=list(subtitle_languages),
     )
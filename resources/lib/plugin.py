@@ -1,10 +1,13 @@
 """Kodi routing layer for the TVStreamCZ add-on."""
 from __future__ import annotations
 
+import re
 import sys
 import urllib.parse
 import datetime
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
 
 import xbmc
 import xbmcaddon
@@ -16,11 +19,66 @@ import xbmcvfs
 if not hasattr(xbmc, 'translatePath'):
     xbmc.translatePath = xbmcvfs.translatePath
 
-from .catalogue import WebshareCatalogue
-from .metadata import MetadataManager
 from .settings import AddonSettings
-from .webshare_api import WebshareAPI, WebshareAuthError, WebshareError
-from .sdilej_api import SdilejAPI
+
+# Entries of the alphabet menu
+_ALPHABET = tuple(chr(code) for code in range(ord("A"), ord("Z") + 1)) + ("0-9",)
+# Basic genre lists for movies and TV shows when no metadata provider has them
+_BASIC_GENRES = {
+    "movie": (
+        "Action", "Adventure", "Animation", "Comedy", "Crime", "Documentary",
+        "Drama", "Family", "Fantasy", "History", "Horror", "Music", "Mystery",
+        "Romance", "Science Fiction", "Thriller", "War", "Western",
+    ),
+    "tvshow": (
+        "Action & Adventure", "Animation", "Comedy", "Crime", "Documentary",
+        "Drama", "Family", "Kids", "Mystery", "News", "Reality", "Sci-Fi & Fantasy",
+        "Soap", "Talk", "War & Politics", "Western",
+    ),
+}
+_BASIC_GENRES_OTHER = ("Action", "Comedy", "Drama", "Horror", "Thriller")
+# Video info labels filled from item metadata, as (info key, metadata key)
+_INFO_METADATA_KEYS = (
+    ("title", "title"),
+    ("originaltitle", "originaltitle"),
+    ("plot", "plot"),
+    ("year", "year"),
+    ("genre", "genres"),
+    ("rating", "rating"),
+    ("votes", "votes"),
+    ("country", "country"),
+)
+# "S01E01", "1x01", "Série 1", "Season 1", "S1", "(2020)", "E01", "ep01", "díl 1"
+_SERIES_STRIP_RE = re.compile(
+    r"\s*-?\s*(?:S\d+E\d+|\d+x\d+|[Ss]ér[ií]e?\s*\d+|[Ss]eason\s*\d+|S\d+|\(\d{4}\)|E\d+|ep\s*\d+|díl\s*\d+).*$",
+    re.IGNORECASE,
+)
+_SEASON_NUMBER_RE = re.compile(r"[Ss]\s*(\d+)")
+_EPISODE_NUMBER_RE = re.compile(r"[Ee]\s*(\d+)")
+
+
+@lru_cache(maxsize=64)
+def _season_marker_re(season_num: int) -> Pattern[str]:
+    """Match "S01", "S1", "série 1" or "season 1" for ``season_num``."""
+    return re.compile(
+        rf"[Ss]\s*{season_num:02d}|[Ss]\s*{season_num}|[Ss]ér[ií]e?\s*{season_num}|[Ss]eason\s*{season_num}",
+        re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=64)
+def _season_episode_re(season_num: int) -> Pattern[str]:
+    return re.compile(rf"S\s*{season_num:02d}?\s*E\s*(\d+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def _series_name(title: str) -> str:
+    # Cut everything from the first season/episode or year marker onwards
+    return _SERIES_STRIP_RE.sub("", title, count=1).strip()
+
+
+def _log(msg: str, level: int = xbmc.LOGDEBUG) -> None:
+    xbmc.log(f"[TVStreamCZ] {msg}", level)
 
 
 class Plugin:
@@ -58,7 +116,8 @@ class Plugin:
         self.base_url = sys.argv[0]
         self.params = dict(urllib.parse.parse_qsl(sys.argv[2][1:])) if len(sys.argv) > 2 else {}
         self.dialog = xbmcgui.Dialog()
-        self._logger = lambda msg, level=xbmc.LOGDEBUG: xbmc.log(f"[TVStreamCZ] {msg}", level)
+        self._loc_cache: Dict[int, str] = {}
+        self._logger = _log
         
         # Load settings with error handling
         try:
@@ -69,8 +128,14 @@ class Plugin:
             # Create a minimal notification about the error
             xbmcgui.Dialog().notification("TVStreamCZ", "Settings loading error", xbmcgui.NOTIFICATION_ERROR)
             raise
-        
-        self.api = WebshareAPI(logger=self._logger)
+
+    # The service clients and the catalogue are built on first use so menu-only
+    # routes never import the HTTP stack or the metadata providers
+    @cached_property
+    def api(self):
+        from .webshare_api import WebshareAPI
+
+        api = WebshareAPI(logger=self._logger)
         token = ""
         try:
             # Use the generic getSetting method for compatibility
@@ -80,25 +145,48 @@ class Plugin:
             self._logger(f"Failed to load session token: {str(e)}", xbmc.LOGWARNING)
             token = ""
         if token:
-            self.api.set_token(token)
+            api.set_token(token)
+        return api
+
+    @cached_property
+    def sdilej_api(self):
+        from .sdilej_api import SdilejAPI
 
-        self.sdilej_api = SdilejAPI(logger=self._logger)
+        return SdilejAPI(logger=self._logger)
 
+    @cached_property
+    def prehrajto_api(self):
         # Initialize Prehraj.to API (no login required for search)
         try:
             from .prehrajto_api import PrehrajtoAPI
-            self.prehrajto_api = PrehrajtoAPI(logger=self._logger)
+            prehrajto_api = PrehrajtoAPI(logger=self._logger)
             self._logger("✓ Prehraj.to API initialized", xbmc.LOGINFO)
+            return prehrajto_api
         except Exception as exc:
             self._logger(f"❌ Failed to initialize Prehraj.to API: {exc}", xbmc.LOGERROR)
-            self.prehrajto_api = None
+            return None
 
-        self.metadata = MetadataManager(self.settings, self._logger) if self.settings.metadata_provider != "none" else None
-        self.catalogue = WebshareCatalogue(self.api, self.metadata, self.settings, self._logger, sdilej_api=self.sdilej_api)
+    @cached_property
+    def metadata(self):
+        if self.settings.metadata_provider == "none":
+            return None
+        from .metadata import MetadataManager
+
+        return MetadataManager(self.settings, self._logger)
+
+    @cached_property
+    def catalogue(self):
+        from .catalogue import WebshareCatalogue
+
+        return WebshareCatalogue(self.api, self.metadata, self.settings, self._logger, sdilej_api=self.sdilej_api)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    @cached_property
+    def _debug_logging(self) -> bool:
+        return xbmc.getCondVisibility("System.GetBool(debug.showloginfo)")
+
     def build_url(self, query: Dict[str, object]) -> str:
         return f"{self.base_url}?{urllib.parse.urlencode(query)}"
 
@@ -108,7 +196,11 @@ class Plugin:
         self._logger(message, level)
 
     def _localized(self, string_id: int) -> str:
-        return self.addon.getLocalizedString(string_id)
+        # Menus ask for the same labels repeatedly; each lookup is a call into Kodi
+        value = self._loc_cache.get(string_id)
+        if value is None:
+            value = self._loc_cache[string_id] = self.addon.getLocalizedString(string_id)
+        return value
 
     def _ensure_credentials(self) -> bool:
         if not self.settings.username or not self.settings.password:
@@ -119,6 +211,8 @@ class Plugin:
     def _ensure_session(self) -> bool:
         if not self._ensure_credentials():
             return False
+        from .webshare_api import WebshareAuthError, WebshareError
+
         try:
             self.api.ensure_logged_in()
             return True
@@ -177,23 +271,15 @@ class Plugin:
             
         # Determine provider
         is_sdilej = getattr(item, "ident", "").startswith("http")
-        provider = "Sdilej" if is_sdilej else "Webshare"
-            
-        suffix_parts = []
-        suffix_parts.append(provider)
-        
-        if item.season is not None and item.episode is not None:
-            suffix_parts.append(f"S{item.season:02d}E{item.episode:02d}")
-        if item.quality and isinstance(item.quality, str):
-            suffix_parts.append(item.quality.upper())
-        if item.audio_languages:
-            suffix_parts.append("/".join(code.upper() for code in item.audio_languages if code and isinstance(code, str)))
-        # Dabing detection
-        dubbing = self._detect_dubbing(getattr(item, 'filename', label))
-        if dubbing:
-            suffix_parts.append(dubbing)
-        if suffix_parts:
-            label = f"{label} [{' | '.join(suffix_parts)}]"
+        # Provider, episode code, quality, audio and dabing; empty parts are skipped
+        parts = (
+            "Sdilej" if is_sdilej else "Webshare",
+            f"S{item.season:02d}E{item.episode:02d}" if item.season is not None and item.episode is not None else "",
+            item.quality.upper() if isinstance(item.quality, str) else "",
+            "/".join(code.upper() for code in item.audio_languages if code and isinstance(code, str)),
+            self._detect_dubbing(getattr(item, 'filename', label)),
+        )
+        label = f"{label} [{' | '.join(part for part in parts if part)}]"
             
         # Color coding based on provider
         if is_sdilej:
@@ -204,28 +290,31 @@ class Plugin:
             label = f"[COLOR deepskyblue]{label}[/COLOR]"
 
         list_item = xbmcgui.ListItem(label=label)
-        info: Dict[str, object] = {
-            "title": item.metadata.get("title") if item.metadata else item.cleaned_title,
-            "originaltitle": item.metadata.get("originaltitle") if item.metadata else item.cleaned_title,
-            "plot": item.metadata.get("plot") if item.metadata else None,
-            "year": item.metadata.get("year") if item.metadata else item.guessed_year,
-            "genre": item.metadata.get("genres") if item.metadata else None,
-            "rating": item.metadata.get("rating") if item.metadata else None,
-            "votes": item.metadata.get("votes") if item.metadata else None,
-            "country": item.metadata.get("country") if item.metadata else None,
-            "size": item.size,
-        }
+        # Empty values are never added, so the dict goes to Kodi as built
+        info: Dict[str, object] = {}
+        if item.metadata:
+            for key, source in _INFO_METADATA_KEYS:
+                value = item.metadata.get(source)
+                if value:
+                    info[key] = value
+        else:
+            if item.cleaned_title:
+                info["title"] = info["originaltitle"] = item.cleaned_title
+            if item.guessed_year:
+                info["year"] = item.guessed_year
+        if item.size:
+            info["size"] = item.size
         if media_type == "movie":
             info["mediatype"] = "movie"
         elif media_type == "tvshow":
             info["mediatype"] = "episode" if item.season is not None else "tvshow"
-            if item.season is not None:
+            if item.season:
                 info["season"] = item.season
-            if item.episode is not None:
+            if item.episode:
                 info["episode"] = item.episode
             if item.metadata and item.metadata.get("title"):
                 info["tvshowtitle"] = item.metadata.get("title")
-        list_item.setInfo("video", {k: v for k, v in info.items() if v})
+        list_item.setInfo("video", info)
         art: Dict[str, str] = {}
         poster = None
         if item.metadata:
@@ -249,130 +338,91 @@ class Plugin:
     # ------------------------------------------------------------------
     # Routes
     # ------------------------------------------------------------------
+    # action -> (method name, query parameters passed positionally)
+    _ROUTES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+        "browse": ("show_browse", ()),
+        "media_root": ("show_media_root", ("media_type",)),
+        "alphabet": ("show_alphabet", ("media_type",)),
+        "genres": ("show_genres", ("media_type",)),
+        "quality_menu": ("show_quality_menu", ("media_type",)),
+        "audio_menu": ("show_audio_menu", ("media_type",)),
+        "subtitle_menu": ("show_subtitle_menu", ("media_type",)),
+        "filters": ("show_filters_menu", ("media_type",)),
+        "search": ("show_search", ("media_type",)),
+        "show_series": ("show_series_list", ()),
+        "show_seasons": ("show_seasons", ("series_name",)),
+        "show_episodes": ("show_episodes", ("series_name", "season")),
+        "show_metadata_seasons": ("show_metadata_seasons", ()),
+        "show_metadata_episodes": ("show_metadata_episodes", ()),
+        "search_and_play_episode": ("search_and_play_episode", ()),
+        "prehrajto_episode_results": ("show_prehrajto_episode_results", ()),
+        "metadata_categories": ("show_metadata_categories", ()),
+        "metadata_movies": ("show_metadata_movies", ()),
+        "metadata_tvshows": ("show_metadata_tvshows", ()),
+        "metadata_movie_category": ("show_metadata_movie_category", ()),
+        "metadata_tv_category": ("show_metadata_tv_category", ()),
+        "metadata_genre_movies": ("show_metadata_genre_movies", ()),
+        "metadata_genre_tvshows": ("show_metadata_genre_tvshows", ()),
+        "metadata_content": ("show_metadata_content", ()),
+        "seasonal_content": ("show_seasonal_content", ()),
+        "show_history": ("show_history", ()),
+        "show_recent": ("show_recent_history", ()),
+        "show_frequent": ("show_frequent_history", ()),
+        "show_favorites": ("show_favorites", ()),
+        "show_resume": ("show_resume_points", ()),
+        "show_stats": ("show_playback_stats", ()),
+        "clear_history": ("clear_history", ()),
+        "add_favorite": ("add_to_favorites", ()),
+        "quick_movie_search": ("quick_movie_search", ()),
+        "show_info": ("show_info", ()),
+        "show_settings": ("show_settings", ()),
+        "check_updates": ("check_updates", ()),
+        "play": ("play_item", ()),
+        # Prehraj.to actions
+        "prehrajto_menu": ("show_prehrajto_menu", ()),
+        "prehrajto_search": ("show_prehrajto_search", ()),
+        "prehrajto_movies": ("show_prehrajto_movies", ()),
+        "prehrajto_tvshows": ("show_prehrajto_tvshows", ()),
+        "prehrajto_news": ("show_prehrajto_news", ()),
+        "prehrajto_browse": ("show_prehrajto_browse", ()),
+        "prehrajto_genres": ("show_prehrajto_genres", ()),
+        "prehrajto_genre_content": ("show_prehrajto_genre_content", ()),
+        "prehrajto_year_picker": ("show_prehrajto_year_picker", ()),
+        "prehrajto_year_content": ("show_prehrajto_year_content", ()),
+        "prehrajto_results": ("show_prehrajto_results", ()),
+        "play_prehrajto": ("play_prehrajto", ()),
+    }
+
     def run(self) -> None:
         action = self.params.get("action")
         self._logger(f"Plugin run() called with action: {action}, params: {self.params}", xbmc.LOGINFO)
-        if action == "browse":
-            self.show_browse()
-        elif action == "media_root":
-            self.show_media_root(self.params.get("media_type"))
-        elif action == "alphabet":
-            self.show_alphabet(self.params.get("media_type"))
-        elif action == "genres":
-            self.show_genres(self.params.get("media_type"))
-        elif action == "quality_menu":
-            self.show_quality_menu(self.params.get("media_type"))
-        elif action == "audio_menu":
-            self.show_audio_menu(self.params.get("media_type"))
-        elif action == "subtitle_menu":
-            self.show_subtitle_menu(self.params.get("media_type"))
-        elif action == "filters":
-            self.show_filters_menu(self.params.get("media_type"))
-        elif action == "search":
-            self.show_search(self.params.get("media_type"))
-        elif action == "show_series":
-            self.show_series_list()
-        elif action == "show_seasons":
-            self.show_seasons(self.params.get("series_name"))
-        elif action == "show_episodes":
-            self.show_episodes(self.params.get("series_name"), self.params.get("season"))
-        elif action == "show_metadata_seasons":
-            self.show_metadata_seasons()
-        elif action == "show_metadata_episodes":
-            self.show_metadata_episodes()
-        elif action == "search_and_play_episode":
-            self.search_and_play_episode()
-        elif action == "prehrajto_episode_results":
-            self.show_prehrajto_episode_results()
-        elif action == "metadata_categories":
-            self.show_metadata_categories()
-        elif action == "metadata_movies":
-            self.show_metadata_movies()
-        elif action == "metadata_tvshows":
-            self.show_metadata_tvshows()
-        elif action == "metadata_movie_category":
-            self.show_metadata_movie_category()
-        elif action == "metadata_tv_category":
-            self.show_metadata_tv_category()
-        elif action == "metadata_genre_movies":
-            self.show_metadata_genre_movies()
-        elif action == "metadata_genre_tvshows":
-            self.show_metadata_genre_tvshows()
-        elif action == "metadata_content":
-            self.show_metadata_content()
-        elif action == "seasonal_content":
-            self.show_seasonal_content()
-        elif action == "show_history":
-            self.show_history()
-        elif action == "show_recent":
-            self.show_recent_history()
-        elif action == "show_frequent":
-            self.show_frequent_history()
-        elif action == "show_favorites":
-            self.show_favorites()
-        elif action == "show_resume":
-            self.show_resume_points()
-        elif action == "show_stats":
-            self.show_playback_stats()
-        elif action == "clear_history":
-            self.clear_history()
-        elif action == "add_favorite":
-            self.add_to_favorites()
-        elif action == "quick_movie_search":
-            self.quick_movie_search()
-        elif action == "show_info":
-            self.show_info()
-        elif action == "show_settings":
-            self.show_settings()
-        elif action == "check_updates":
-            self.check_updates()
-        elif action == "play":
-            self._logger("SUCCESS: 'play' action recognized, calling play_item()", xbmc.LOGINFO)
-            self.play_item()
-        # Prehraj.to actions
-        elif action == "prehrajto_menu":
-            self.show_prehrajto_menu()
-        elif action == "prehrajto_search":
-            self.show_prehrajto_search()
-        elif action == "prehrajto_movies":
-            self.show_prehrajto_movies()
-        elif action == "prehrajto_tvshows":
-            self.show_prehrajto_tvshows()
-        elif action == "prehrajto_news":
-            self.show_prehrajto_news()
-        elif action == "prehrajto_browse":
-            self.show_prehrajto_browse()
-        elif action == "prehrajto_genres":
-            self.show_prehrajto_genres()
-        elif action == "prehrajto_genre_content":
-            self.show_prehrajto_genre_content()
-        elif action == "prehrajto_year_picker":
-            self.show_prehrajto_year_picker()
-        elif action == "prehrajto_year_content":
-            self.show_prehrajto_year_content()
-        elif action == "prehrajto_results":
-            self.show_prehrajto_results()
-        elif action == "play_prehrajto":
-            self.play_prehrajto()
-        else:
+        route = self._ROUTES.get(action)
+        if route is None:
             self._logger(f"WARNING: Unknown action '{action}', showing root menu", xbmc.LOGWARNING)
             self.show_root()
+            return
+        if action == "play":
+            self._logger("SUCCESS: 'play' action recognized, calling play_item()", xbmc.LOGINFO)
+        method, keys = route
+        getattr(self, method)(*(self.params.get(key) for key in keys))
 
     def show_root(self) -> None:
         xbmcplugin.setPluginCategory(self.handle, self.addon.getAddonInfo("name"))
         xbmcplugin.setContent(self.handle, "videos")
         entries = [
-            ("[COLOR deeppink]>>SPUSTIT<<[/COLOR]", {"action": "prehrajto_menu"}),
-            ("Historie sledování",                                  {"action": "show_history"}),
-            ("INFORMACE",                                          {"action": "show_info"}),
-            ("NASTAVENÍ PLUGINU",                                  {"action": "show_settings"}),
-            ("AKTUALIZACE",                                        {"action": "check_updates"}),
-            ("[COLOR gray]V PŘÍPRAVĚ[/COLOR]",                    {"action": "show_info"}),
+            ("[COLOR deeppink]>>SPUSTIT<<[/COLOR]", "prehrajto_menu"),
+            ("Historie sledování",                                  "show_history"),
+            ("INFORMACE",                                          "show_info"),
+            ("NASTAVENÍ PLUGINU",                                  "show_settings"),
+            ("AKTUALIZACE",                                        "check_updates"),
+            ("[COLOR gray]V PŘÍPRAVĚ[/COLOR]",                    "show_info"),
         ]
-        for label, query in entries:
-            url = self.build_url(query)
-            item = xbmcgui.ListItem(label=label)
-            xbmcplugin.addDirectoryItem(self.handle, url, item, isFolder=True)
+        # Static ASCII actions need no encoding
+        listing = [
+            (f"{self.base_url}?action={action}", xbmcgui.ListItem(label=label), True)
+            for label, action in entries
+        ]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_media_root(self, media_type: Optional[str]) -> None:
@@ -389,9 +439,11 @@ class Plugin:
             (self._localized(32027), {"action": "filters", "media_type": media_type}),
             (self._localized(32006), {"action": "search", "media_type": media_type}),
         ]
-        for label, params in items:
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=label), isFolder=True)
+        listing = [
+            (self.build_url(params), xbmcgui.ListItem(label=label), True)
+            for label, params in items
+        ]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_alphabet(self, media_type: Optional[str]) -> None:
@@ -400,15 +452,10 @@ class Plugin:
             return
         xbmcplugin.setPluginCategory(self.handle, self._localized(32003))
         xbmcplugin.setContent(self.handle, "videos")
-        letters = [chr(code) for code in range(ord("A"), ord("Z") + 1)] + ["0-9"]
-        for letter in letters:
-            params = {
-                "action": "browse",
-                "media_type": media_type,
-                "letter": letter,
-            }
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=letter), isFolder=True)
+        # Only media_type needs encoding; the appended letters are URL-safe
+        prefix = self.build_url({"action": "browse", "media_type": media_type})
+        listing = [(f"{prefix}&letter={letter}", xbmcgui.ListItem(label=letter), True) for letter in _ALPHABET]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_filters_menu(self, media_type: Optional[str]) -> None:
@@ -422,9 +469,11 @@ class Plugin:
             (self._localized(32011), {"action": "audio_menu", "media_type": media_type}),
             (self._localized(32012), {"action": "subtitle_menu", "media_type": media_type}),
         ]
-        for label, params in entries:
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=label), isFolder=True)
+        listing = [
+            (self.build_url(params), xbmcgui.ListItem(label=label), True)
+            for label, params in entries
+        ]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_quality_menu(self, media_type: Optional[str]) -> None:
@@ -439,15 +488,9 @@ class Plugin:
             (self._localized(32038), "uhd"),
             (self._localized(32039), "sd"),
         ]
-        for label, quality in options:
-            params = {
-                "action": "browse",
-                "media_type": media_type,
-            }
-            if quality:
-                params["quality"] = quality
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=label), isFolder=True)
+        prefix = self.build_url({"action": "browse", "media_type": media_type})
+        listing = [(f"{prefix}&quality={quality}", xbmcgui.ListItem(label=label), True) for label, quality in options]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_audio_menu(self, media_type: Optional[str]) -> None:
@@ -462,12 +505,9 @@ class Plugin:
             (self._localized(32016), "sk"),
             (self._localized(32015), "en"),
         ]
-        for label, audio in options:
-            params = {"action": "browse", "media_type": media_type}
-            if audio:
-                params["audio"] = audio
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=label), isFolder=True)
+        prefix = self.build_url({"action": "browse", "media_type": media_type})
+        listing = [(f"{prefix}&audio={audio}", xbmcgui.ListItem(label=label), True) for label, audio in options]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_subtitle_menu(self, media_type: Optional[str]) -> None:
@@ -482,12 +522,9 @@ class Plugin:
             (self._localized(32016), "sk"),
             (self._localized(32015), "en"),
         ]
-        for label, subs in options:
-            params = {"action": "browse", "media_type": media_type}
-            if subs:
-                params["subtitles"] = subs
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=label), isFolder=True)
+        prefix = self.build_url({"action": "browse", "media_type": media_type})
+        listing = [(f"{prefix}&subtitles={subs}", xbmcgui.ListItem(label=label), True) for label, subs in options]
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_genres(self, media_type: Optional[str]) -> None:
@@ -502,17 +539,7 @@ class Plugin:
             
         # If no metadata provider or no genres from metadata, use basic genre list
         if not genres:
-            # Basic genre list for movies and TV shows
-            if media_type == "movie":
-                genres = ["Action", "Adventure", "Animation", "Comedy", "Crime", "Documentary", 
-                         "Drama", "Family", "Fantasy", "History", "Horror", "Music", "Mystery", 
-                         "Romance", "Science Fiction", "Thriller", "War", "Western"]
-            elif media_type == "tvshow":
-                genres = ["Action & Adventure", "Animation", "Comedy", "Crime", "Documentary", 
-                         "Drama", "Family", "Kids", "Mystery", "News", "Reality", "Sci-Fi & Fantasy", 
-                         "Soap", "Talk", "War & Politics", "Western"]
-            else:
-                genres = ["Action", "Comedy", "Drama", "Horror", "Thriller"]
+            genres = _BASIC_GENRES.get(media_type, _BASIC_GENRES_OTHER)
                 
         if not genres:
             self.notify("No genres available", level=xbmc.LOGINFO)
@@ -520,10 +547,11 @@ class Plugin:
             return
         xbmcplugin.setPluginCategory(self.handle, self._localized(32004))
         xbmcplugin.setContent(self.handle, "videos")
+        listing = []
         for genre in genres:
             params = {"action": "browse", "media_type": media_type, "genre": genre.lower()}
-            url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(self.handle, url, xbmcgui.ListItem(label=genre), isFolder=True)
+            listing.append((self.build_url(params), xbmcgui.ListItem(label=genre), True))
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def show_search(self, media_type: Optional[str]) -> None:
@@ -567,8 +595,9 @@ class Plugin:
         self.show_browse()
 
     def show_browse(self) -> None:
-        media_type = self.params.get("media_type")
-        query = self.params.get("query", "")
+        params = self.params
+        media_type = params.get("media_type")
+        query = params.get("query") or ""
         
         self._logger(f"show_browse: media_type={media_type}, query={query}", xbmc.LOGINFO)
         
@@ -583,7 +612,7 @@ class Plugin:
             )
             # If most items are TV shows, treat as TV content
             if test_items:
-                tv_count = sum(1 for item in test_items if item.media_type == "tvshow")
+                tv_count = [item.media_type for item in test_items].count("tvshow")
                 self._logger(f"Found {len(test_items)} items, {tv_count} are TV shows", xbmc.LOGINFO)
                 if tv_count >= len(test_items) / 2:  # More than half are TV shows
                     media_type = "tvshow"
@@ -596,15 +625,14 @@ class Plugin:
             self.show_series_list()
             return
             
-        letter = self.params.get("letter")
-        quality = self.params.get("quality") or self.settings.default_quality
-        audio = self.params.get("audio") or self.settings.default_audio
-        subtitles = self.params.get("subtitles") or self.settings.default_subtitles
-        genre = self.params.get("genre")
-        sort = self.params.get("sort")
-        query = self.params.get("query") or ""
-        seasonal = self.params.get("seasonal")
-        offset = int(self.params.get("offset", "0"))
+        letter = params.get("letter")
+        quality = params.get("quality") or self.settings.default_quality
+        audio = params.get("audio") or self.settings.default_audio
+        subtitles = params.get("subtitles") or self.settings.default_subtitles
+        genre = params.get("genre")
+        sort = params.get("sort")
+        seasonal = params.get("seasonal")
+        offset = int(params.get("offset", "0"))
         
         # Handle seasonal content search
         if seasonal:
@@ -644,6 +672,7 @@ class Plugin:
             # For small result sets, show as regular directory so user can see all options
             pass  # Continue to show directory listing below
             
+        listing = []
         for item in items:
             ident = getattr(item, "ident", None)
             if not ident:
@@ -677,8 +706,7 @@ class Plugin:
             if hasattr(item, 'episode') and item.episode:
                 play_params["episode"] = item.episode
             
-            url = self.build_url(play_params)
-            xbmcplugin.addDirectoryItem(self.handle, url, list_item, isFolder=False)
+            listing.append((self.build_url(play_params), list_item, False))
         if has_more:
             params = {
                 "action": "browse",
@@ -697,12 +725,8 @@ class Plugin:
                 params["subtitles"] = subtitles
             params = {k: v for k, v in params.items() if v not in (None, "")}
             next_url = self.build_url(params)
-            xbmcplugin.addDirectoryItem(
-                self.handle,
-                next_url,
-                xbmcgui.ListItem(label=self._localized(32010)),
-                isFolder=True,
-            )
+            listing.append((next_url, xbmcgui.ListItem(label=self._localized(32010)), True))
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
 
     def play_item(self) -> None:
@@ -747,6 +771,8 @@ class Plugin:
             self._logger("ERROR: Session ensure failed - authentication problem", xbmc.LOGERROR)
             xbmcplugin.setResolvedUrl(self.handle, False, xbmcgui.ListItem())
             return
+        from .webshare_api import WebshareError
+
         try:
             link = self.api.file_link(
                 ident,
@@ -804,14 +830,20 @@ class Plugin:
         
         # Extract unique series names
         series_names = set()
+        series_names_lower = set()
         series_examples = {}
+        # Per-item lines are only formatted when Kodi debug logging is on
+        debug_logging = self._debug_logging
         
         for item in items:
             # Clean series name
             series_name = self._extract_series_name(item.cleaned_title)
-            self._logger(f"Item: '{item.cleaned_title}' -> series: '{series_name}'", xbmc.LOGINFO)
+            if debug_logging:
+                self._logger(f"Item: '{item.cleaned_title}' -> series: '{series_name}'")
             
-            if series_name and series_name.lower() not in [s.lower() for s in series_names]:
+            series_lower = series_name.lower()
+            if series_lower and series_lower not in series_names_lower:
+                series_names_lower.add(series_lower)
                 series_names.add(series_name)
                 series_examples[series_name] = item
         
@@ -826,6 +858,7 @@ class Plugin:
         xbmcplugin.setPluginCategory(self.handle, f"Nalezené seriály ({len(series_names)})")
         xbmcplugin.setContent(self.handle, "episodes")
         
+        listing = []
         for series_name in sorted(series_names):
             example_item = series_examples.get(series_name)
             if example_item:
@@ -842,7 +875,7 @@ class Plugin:
                                 "original_query": query,
                                 "source": self.params.get("source", "webshare"),
                             })
-                            xbmcplugin.addDirectoryItem(self.handle, url, list_item, isFolder=True)
+                            listing.append((url, list_item, True))
                             continue
                     except Exception as exc:
                         self._logger(f"Metadata lookup for '{series_name}' failed: {exc}", xbmc.LOGDEBUG)
@@ -851,8 +884,9 @@ class Plugin:
                     "series_name": series_name,
                     "original_query": query,
                 })
-                xbmcplugin.addDirectoryItem(self.handle, url, list_item, isFolder=True)
+                listing.append((url, list_item, True))
         
+        xbmcplugin.addDirectoryItems(self.handle, listing, len(listing))
         xbmcplugin.endOfDirectory(self.handle)
     
     def _show_browse_series_list(self) -> None:
@@ -863,27 +897,7 @@ class Plugin:
     
     def _extract_series_name(self, title: str) -> str:
         """Extract clean series name from title."""
-        # Remove common season/episode patterns
-        import re
-        
-        # Remove patterns like "S01E01", "1x01", "Series 1", etc.
-        patterns = [
-            r'\s*-?\s*S\d+E\d+.*$',  # S01E01...
-            r'\s*-?\s*\d+x\d+.*$',   # 1x01...  
-            r'\s*-?\s*[Ss]ér[ií]e?\s*\d+.*$',  # Série 1...
-            r'\s*-?\s*[Ss]eason\s*\d+.*$',     # Season 1...
-            r'\s*-?\s*S\d+.*$',      # S1, S01...
-            r'\s*-?\s*\(\d{4}\).*$', # (2020)...
-            r'\s*-?\s*E\d+.*$',      # E01...
-            r'\s*-?\s*ep\s*\d+.*$',  # ep01...
-            r'\s*-?\s*díl\s*\d+.*$', # díl 1...
-        ]
-        
-        clean_title = title
-        for pattern in patterns:
-            clean_title = re.sub(pattern, '', clean_title, flags=re.IGNORECASE)
-        
-        return clean_title.strip()
+        return _series_name(title)
 
     def show_seasons(self, series_name: str) -> None:
         """Show seasons for a specific TV series using metadata."""
@@ -972,14 +986,9 @@ class Plugin:
         query_terms = [series_name, f"{series_name} S01", f"{series_name} série"]
         seasons_found = set()
         
-        for term in query_terms:
+        for future in self._tv_searches(query_terms, 20):  # Small sample
             try:
-                items, _, _, _ = self.catalogue.fetch(
-                    media_type="tvshow",
-                    query=term,
-                    start_offset=0,
-                    page_size=20  # Small sample
-                )
+                items, _, _, _ = future.result()
                 
                 for item in items:
                     if self._extract_series_name(item.cleaned_title).lower() == series_name.lower():
@@ -987,8 +996,7 @@ class Plugin:
                             seasons_found.add(item.season)
                         else:
                             # Try to extract season from title
-                            import re
-                            season_match = re.search(r'[Ss]\s*(\d+)', item.cleaned_title)
+                            season_match = _SEASON_NUMBER_RE.search(item.cleaned_title)
                             if season_match:
                                 seasons_found.add(int(season_match.group(1)))
                             else:
@@ -1003,6 +1011,30 @@ class Plugin:
         
         return list(seasons_found) if seasons_found else [1]
 
+    def _tv_searches(self, queries: List[str], page_size: int) -> Iterator[Future]:
+        """Yield a TV catalogue search per query, in query order.
+
+        Only the next query runs ahead of the one being read, so a caller that
+        stops early leaves at most one search unfinished instead of all of them.
+        """
+        catalogue = self.catalogue
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        def submit(index: int) -> Optional[Future]:
+            if index >= len(queries):
+                return None
+            return executor.submit(
+                catalogue.fetch, media_type="tvshow", query=queries[index], start_offset=0, page_size=page_size
+            )
+
+        ahead = submit(0)
+        try:
+            for index in range(len(queries)):
+                current, ahead = ahead, submit(index + 1)
+                yield current
+        finally:
+            executor.shutdown(wait=False)
+
     def show_episodes(self, series_name: str, season: str) -> None:
         """Show episodes for a specific season - optimized search."""
         if not series_name or not season:
@@ -1072,14 +1104,9 @@ class Plugin:
         
         found_items = set()  # Track items by ident to avoid duplicates
         
-        for pattern in search_patterns:
+        for pattern, future in zip(search_patterns, self._tv_searches(search_patterns, 50)):
             try:
-                items, _, _, _ = self.catalogue.fetch(
-                    media_type="tvshow",
-                    query=pattern,
-                    start_offset=0,
-                    page_size=50
-                )
+                items, _, _, _ = future.result()
                 
                 for item in items:
                     # Check if this item belongs to our series and season
@@ -1112,19 +1139,7 @@ class Plugin:
             return True
             
         # Try to extract season from title if item.season is not set
-        import re
-        season_patterns = [
-            rf'[Ss]\s*{season_num:02d}',  # S01, s01
-            rf'[Ss]\s*{season_num}',      # S1, s1
-            rf'[Ss]ér[ií]e?\s*{season_num}',  # série 1, serie 1
-            rf'[Ss]eason\s*{season_num}',     # season 1
-        ]
-        
-        for pattern in season_patterns:
-            if re.search(pattern, item.cleaned_title, re.IGNORECASE):
-                return True
-                
-        return False
+        return _season_marker_re(season_num).search(item.cleaned_title) is not None
     
     def _format_episode_label(self, item, season_num: int) -> str:
         """Format episode label for display."""
@@ -1132,13 +1147,12 @@ class Plugin:
             return f"Epizoda {item.episode}"
         
         # Try to extract episode number from title
-        import re
-        ep_match = re.search(r'[Ee]\s*(\d+)', item.cleaned_title)
+        ep_match = _EPISODE_NUMBER_RE.search(item.cleaned_title)
         if ep_match:
             return f"Epizoda {ep_match.group(1)}"
         
         # Try to extract from SxxExx pattern
-        se_match = re.search(rf'S\s*{season_num:02d}?\s*E\s*(\d+)', item.cleaned_title, re.IGNORECASE)
+        se_match = _season_episode_re(season_num).search(item.cleaned_title)
         if se_match:
             return f"Epizoda {se_match.group(1)}"
             
@@ -2025,10 +2039,10 @@ class Plugin:
             if hasattr(item, 'metadata') and item.metadata and item.metadata.get("title"):
                 item_title = item.metadata.get("title").lower()
             elif hasattr(item, 'cleaned_title') and item.cleaned_title:
-                item_title = item.cleaned_title.lower()
+                item_title = item.cleaned_title_lower
                 
             if hasattr(item, 'original_name') and item.original_name:
-                item_filename = item.original_name.lower()
+                item_filename = item.original_name_lower
             
             # Title matching with scoring
             if title_lower:
@@ -3715,7 +3729,7 @@ Tipy pro lepší výsledky:
                 sort_title=clean.lower(),
                 guessed_year=yr,
             )
-            self.metadata.enrich(item)
+            self.metadata.enrich(item, detailed=True)
             meta = item.metadata or {}
             out["originaltitle"] = str(meta.get("originaltitle") or "").strip()
             out["imdb"] = str(meta.get("imdb") or "").strip()
@@ -23,6 +23,7 @@ class AddonSettings:
     metadata_language: str
     metadata_region: str
     csfd_user_agent: str
+    metadata_parallel: bool
     download_type: str
     force_https: bool
     sledujfilmy_enabled: bool
@@ -90,6 +91,7 @@ class AddonSettings:
         metadata_language = _get_string("metadata_language", "cs-CZ")
         metadata_region = _get_string("metadata_region", "CZ")
         csfd_user_agent = _get_string("csfd_user_agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64)")
+        metadata_parallel = _get_bool("metadata_parallel", False)
         download_type = _get_enum("download_type", download_options)
         force_https = _get_bool("force_https", True)
         
@@ -109,6 +111,7 @@ class AddonSettings:
             metadata_language=metadata_language.strip(),
             metadata_region=metadata_region.strip(),
             csfd_user_agent=csfd_user_agent.strip(),
+            metadata_parallel=metadata_parallel,
             download_type=download_type,
             force_https=force_https,
             sledujfilmy_enabled=sledujfilmy_enabled,
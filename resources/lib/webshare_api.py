@@ -2,15 +2,33 @@
 from __future__ import annotations
 
 import hashlib
+import threading
 import time
+from collections import OrderedDict
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 
 import requests
 import xbmc
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .md5crypt import md5_crypt
 
+# The only <file> children parse_media_entry() reads from a search result
+_SEARCH_FIELDS = (
+    "name",
+    "ident",
+    "type",
+    "size",
+    "img",
+    "stripe",
+    "stripe_count",
+    "positive_votes",
+    "negative_votes",
+    "password",
+)
+
 
 class WebshareError(Exception):
     """Generic Webshare API error."""
@@ -32,12 +50,27 @@ class WebshareAPI:
         "User-Agent": "Kodi-TVStreamCZ/0.1.0",
     }
 
+    POOL_MAXSIZE = 8
+    MAX_SEARCH_LIMIT = 100
+    # Latest search responses of this invocation; the browse type probe and the
+    # listing that follows it request the same first page
+    SEARCH_CACHE_SIZE = 4
+
     def __init__(self, logger=None):
         self._session = requests.Session()
         self._session.headers.update(self.DEFAULT_HEADERS)
+        # Keep one warm TLS connection pool to webshare.cz across paginated calls
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        self._session.mount("https://", adapter)
         self._token: Optional[str] = None
         self._token_verified = False
         self._token_checked_at: float = 0.0
+        self._search_cache: "OrderedDict[tuple, ET.Element]" = OrderedDict()
+        self._search_lock = threading.Lock()
         self._logger = logger or (lambda msg, level=xbmc.LOGINFO: xbmc.log(msg, level))
 
     @property
@@ -52,7 +85,7 @@ class WebshareAPI:
         else:
             self._session.cookies.pop("wst", None)
 
-    def _parse_xml(self, payload: str) -> ET.Element:
+    def _parse_xml(self, payload: bytes) -> ET.Element:
         try:
             root = ET.fromstring(payload)
         except ET.ParseError as exc:
@@ -77,7 +110,7 @@ class WebshareAPI:
             response.raise_for_status()
         except requests.RequestException as exc:
             raise WebshareError(f"HTTP request failed: {exc}") from exc
-        return self._parse_xml(response.text)
+        return self._parse_xml(response.content)
 
     def _fetch_salt(self, username: str) -> Optional[str]:
         try:
@@ -141,26 +174,45 @@ class WebshareAPI:
             self.set_token(None)
             raise WebshareAuthError("Session expired.") from exc
 
-    def search(self, what: str = "", category: str = "video", sort: Optional[str] = None, limit: int = 40, offset: int = 0) -> Tuple[int, List[Dict[str, str]]]:
+    def search(self, what: str = "", category: str = "video", sort: Optional[str] = None, limit: int = 40, offset: int = 0) -> Tuple[int, Iterator[Dict[str, str]]]:
+        """Return the total hit count and a lazy iterator over this page's entries.
+
+        ``total`` is read eagerly; each entry dict is only built when consumed.
+        """
         data: Dict[str, object] = {
             "what": what or "",
             "category": category,
-            "limit": max(1, min(100, limit)),
+            "limit": max(1, min(self.MAX_SEARCH_LIMIT, limit)),
             "offset": max(0, offset),
         }
         if sort:
             data["sort"] = sort
-        root = self._post("/search/", data)
+        root = self._search_root(data)
         total = int(root.findtext("total", "0") or 0)
-        files: List[Dict[str, str]] = []
-        for node in root.findall("file"):
-            entry = {child.tag: child.text or "" for child in list(node)}
-            files.append(entry)
+        files = (
+            {name: node.findtext(name) or "" for name in _SEARCH_FIELDS}
+            for node in root.iterfind("file")
+        )
         return total, files
 
+    def _search_root(self, data: Dict[str, object]) -> ET.Element:
+        key = tuple(sorted(data.items()))
+        with self._search_lock:
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                self._search_cache.move_to_end(key)
+                return cached
+        root = self._post("/search/", data)
+        with self._search_lock:
+            self._search_cache[key] = root
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return root
+
     def file_info(self, ident: str) -> Dict[str, str]:
         root = self._post("/file_info/", {"ident": ident}, require_token=True)
-        return {child.tag: child.text or "" for child in list(root) if child.tag != "status"}
+        return {child.tag: child.text or "" for child in root if child.tag != "status"}
 
     def file_link(self, ident: str, download_type: str = "video_stream", password: Optional[str] = None, force_https: bool = True) -> str:
         data: Dict[str, object] = {